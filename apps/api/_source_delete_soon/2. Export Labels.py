@@ -4,6 +4,8 @@ import geopandas as gpd
 from shapely.geometry import Point
 from pyproj import CRS
 import ezdxf
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 # -------------------------
 # USER CONFIG
@@ -139,7 +141,11 @@ for i in range(min(5, len(labels))):
 # -------------------------
 # EXPORT CSV
 # -------------------------
-labels[["PARCELID_JOIN", "X", "Y", "LABEL"]].to_csv(OUTPUT_CSV, index=False)
+# Arrow's multithreaded CSV writer is much faster than to_csv for multi-line label text
+pacsv.write_csv(
+    pa.Table.from_pandas(labels[["PARCELID_JOIN", "X", "Y", "LABEL"]], preserve_index=False),
+    OUTPUT_CSV
+)
 print(f"Wrote {OUTPUT_CSV}")
 
 # -------------------------
@@ -1,7 +1,6 @@
 """
 Configuration module - Database and Azure initialization
 """
-from storage.az import AzureStorageManager
 from storage.db import DatabaseManager
 from config.settings import NAME
 
@@ -11,6 +11,14 @@ load_dotenv()
 MONGO_CONNECTION_STRING = os.getenv("MONGO_CONNECTION_STRING")
 NAME = os.getenv("NAME", "county_research")
 
+# MongoDB connection pool (maxPoolSize ~ peak concurrent operations x 1.25)
+MONGO_MAX_POOL_SIZE = 50
+MONGO_MIN_POOL_SIZE = 5
+MONGO_MAX_IDLE_TIME_MS = 60000
+MONGO_SERVER_SELECTION_TIMEOUT_MS = 5000
+STATISTICS_CACHE_TTL = 10  # seconds to reuse dashboard statistics
+PROJECT_COUNT_CACHE_TTL = 30  # seconds to reuse paginated project totals per filter
+
 # Azure Storage
 AZURE_CONNECTION_STRING = os.getenv("AZURE_CONNECTION_STRING")
 
@@ -21,6 +29,8 @@ REQUIRE_AUTH = os.getenv("REQUIRE_AUTH", "false").lower() == "true"
 
 # Worker Configuration
 WORKER_POLL_INTERVAL = 5  # seconds between polling for new jobs
+WORKER_MAX_CONCURRENT_JOBS = 3  # jobs processed at once by one worker
+BROWSER_POOL_SIZE = WORKER_MAX_CONCURRENT_JOBS  # pooled browser contexts, one per concurrent job
 JOB_RETENTION_DAYS = 3    # days to keep completed jobs before cleanup
 
 # Scraping Configuration (polite delays for GIS portals)
@@ -30,6 +40,12 @@ SCRAPER_PDF_DELAY_MIN = 6.0   # seconds between PDF downloads
 SCRAPER_PDF_DELAY_MAX = 12.0
 SCRAPER_BROWSER_TIMEOUT_MS = 35000  # 35 seconds
 
+# Process-wide request rates (token buckets shared by all jobs)
+SCRAPER_PAGE_RATE = float(os.getenv("SCRAPER_PAGE_RATE", "5"))   # parcel page requests per second, across all jobs
+SCRAPER_PAGE_BURST = int(os.getenv("SCRAPER_PAGE_BURST", "20"))
+AZURE_OPS_RATE = float(os.getenv("AZURE_OPS_RATE", "200"))       # Azure Blob Storage HTTP requests per second (well under account limits)
+AZURE_OPS_BURST = int(os.getenv("AZURE_OPS_BURST", "500"))
+
 # API Configuration
 API_TITLE = "County Research Automation API"
 API_VERSION = "2.0.0"
@@ -38,6 +54,8 @@ API_DESCRIPTION = "API for automating county parcel research and GIS data extrac
 # File Upload Limits
 MAX_UPLOAD_SIZE_MB = 5120  # 5 GB in megabytes
 MAX_UPLOAD_SIZE_BYTES = MAX_UPLOAD_SIZE_MB * 1024 * 1024
+MAX_PARCEL_FILE_SIZE_MB = 8  # parcel lists are capped at 1000 IDs, so a few MB is plenty
+MAX_PARCEL_FILE_SIZE_BYTES = MAX_PARCEL_FILE_SIZE_MB * 1024 * 1024
 
 # CORS Configuration
 CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
@@ -11,14 +11,17 @@ from config.settings import (
     API_DESCRIPTION,
     CORS_ORIGINS,
     WORKER_POLL_INTERVAL,
+    WORKER_MAX_CONCURRENT_JOBS,
     JOB_RETENTION_DAYS
 )
 from config.main import DB
+from storage.db import close_mongo_client
 
 # Import routers
 from routes.jobs import jobs_router
 from worker import ParcelJobWorker
 from scheduler import JobCleanupScheduler
+from scrapers.browser_pool import shutdown_pool
 
 # On Windows, set event loop policy for Playwright support
 if sys.platform == 'win32':
@@ -67,9 +70,9 @@ async def startup_event():
     
     # Start the worker thread
     try:
-        worker = ParcelJobWorker(DB, poll_interval=WORKER_POLL_INTERVAL)
+        worker = ParcelJobWorker(DB, poll_interval=WORKER_POLL_INTERVAL, max_concurrent_jobs=WORKER_MAX_CONCURRENT_JOBS)
         worker.start()
-        print(f"✓ Worker started (poll interval: {WORKER_POLL_INTERVAL}s)")
+        print(f"✓ Worker started (poll interval: {WORKER_POLL_INTERVAL}s, {WORKER_MAX_CONCURRENT_JOBS} concurrent jobs)")
     except Exception as e:
         print(f"✗ Failed to start worker: {e}")
     
@@ -84,6 +87,25 @@ async def startup_event():
     print("✅ API ready!\n")
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """
+    FastAPI shutdown event handler.
+    
+    Closes the shared scraper browser, if a job ever started it, and the
+    shared MongoDB client.
+    """
+    try:
+        shutdown_pool()
+    except Exception as e:
+        print(f"✗ Failed to close browser pool: {e}")
+    
+    try:
+        close_mongo_client()
+    except Exception as e:
+        print(f"✗ Failed to close MongoDB client: {e}")
+
+
 @app.get(
     '/',
     summary="API root",
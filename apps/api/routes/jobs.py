@@ -7,7 +7,7 @@ import os
 import tempfile
 import io
 from config.main import DB
-from config.settings import MAX_UPLOAD_SIZE_BYTES
+from config.settings import MAX_UPLOAD_SIZE_BYTES, MAX_PARCEL_FILE_SIZE_BYTES
 from models.ParcelJob import ParcelJob, ParcelJobProgress, ParcelJobResult
 from utils.file_parser import parse_parcel_file, validate_parcel_ids
 from auth.entra_id import get_current_user
@@ -53,7 +53,7 @@ async def create_parcel_job(
     Create a new parcel research job
     
     Accepts:
-    - Parcel file (TXT, CSV, or XLSX) - max 5GB
+    - Parcel file (TXT, CSV, or XLSX) - max 8MB
     - Shapefile ZIP (optional) - max 5GB. If not provided, will use pre-supplied shapefiles from Azure
     - County, CRS, and GIS URL
     
@@ -66,10 +66,10 @@ async def create_parcel_job(
     parcel_size = parcel_file.file.tell()
     parcel_file.file.seek(0)  # Reset to start
     
-    if parcel_size > MAX_UPLOAD_SIZE_BYTES:
+    if parcel_size > MAX_PARCEL_FILE_SIZE_BYTES:
         raise HTTPException(
             status_code=413,
-            detail=f"Parcel file too large. Max size: {MAX_UPLOAD_SIZE_BYTES / (1024**3):.1f} GB"
+            detail=f"Parcel file too large. Max size: {MAX_PARCEL_FILE_SIZE_BYTES / (1024**2):.0f} MB"
         )
     
     # Validate parcel file type
@@ -175,6 +175,7 @@ async def create_parcel_job(
     )
     
     DB.parcelJobsCollection.insert_one(job._to_dict())
+    DB.notify_job_queued(job_id)
     
     return {
         "job_id": job_id,
@@ -382,14 +383,7 @@ async def delete_job(job_id: str, user: Optional[dict] = Depends(get_current_use
     # Delete Azure files
     try:
         # Delete all blobs with prefix jobs/{job_id}/
-        prefix = f"jobs/{job_id}/"
-        blob_list = DB.az.container_client.list_blobs(name_starts_with=prefix)
-        deleted_count = 0
-        for blob in blob_list:
-            DB.az.container_client.delete_blob(blob.name)
-            deleted_count += 1
-        
-        print(f"Deleted {deleted_count} blobs for job {job_id}")
+        DB.az.delete_job_files(job_id)
     except Exception as e:
         print(f"Error deleting Azure files for job {job_id}: {e}")
     
@@ -576,6 +570,7 @@ async def retry_job(job_id: str, user: Optional[dict] = Depends(get_current_user
         )
         
         DB.parcelJobsCollection.insert_one(new_job._to_dict())
+        DB.notify_job_queued(new_job_id)
         
         return {
             "job_id": new_job_id,
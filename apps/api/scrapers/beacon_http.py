@@ -0,0 +1,191 @@
+"""
+Plain-HTTP fast path for Beacon property pages
+
+Beacon's property detail page (PageTypeID=4) is rendered server side, so
+once the browser has found one parcel we know the page URL pattern and
+can fetch the rest directly with a keep-alive HTTP/2 client instead of
+driving Chromium through the search box. Anything that does not look like
+a property page (consent screen, error page, unknown layout) returns None
+and the caller falls back to Playwright.
+"""
+from typing import Dict, Optional
+import re
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+import httpx
+from selectolax.parser import HTMLParser
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+HTTP_TIMEOUT_SECONDS = 30
+
+OWNER_SELECTORS = [
+    'a[id*="lnkOwnerName"]',  # Link with owner name (most common in Beacon)
+    'span[id*="lblOwnerName"]',
+    'span[id*="lblOwner"]',
+    'span[id*="Owner1"]'
+]
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for Beacon requests"""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        headers={
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,*/*",
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+        timeout=HTTP_TIMEOUT_SECONDS,
+        follow_redirects=True
+    )
+
+
+def property_url_for(template_url: str, parcel_id: str) -> Optional[str]:
+    """
+    Build a property page URL for another parcel from a known one
+
+    Args:
+        template_url: URL of any property page (PageTypeID=4 with KeyValue)
+        parcel_id: Parcel ID to substitute for KeyValue
+
+    Returns:
+        Property page URL, or None if the template has no KeyValue parameter
+    """
+    parsed = urlparse(template_url)
+    params = parse_qs(parsed.query)
+    if 'PageTypeID' not in params or 'KeyValue' not in params:
+        return None
+    params['KeyValue'] = [parcel_id]
+    return urlunparse(parsed._replace(query=urlencode(params, doseq=True)))
+
+
+def _text(tree: HTMLParser, selector: str) -> str:
+    """Stripped text of the first node matching selector, or ''"""
+    node = tree.css_first(selector)
+    return node.text(separator='\n').strip() if node else ''
+
+
+def _absolute(href: str, page_url: str) -> str:
+    """Resolve a Beacon link relative to the page it came from"""
+    parsed = urlparse(page_url)
+    base_domain = f"{parsed.scheme}://{parsed.netloc}"
+    if href.startswith('/'):
+        return base_domain + href
+    if not href.startswith('http'):
+        return base_domain + '/' + href
+    return href
+
+
+def parse_property_page(html: str, page_url: str) -> Optional[Dict]:
+    """
+    Extract parcel fields from a Beacon property page
+
+    Args:
+        html: Property page HTML
+        page_url: URL the HTML was served from (for resolving PRC links)
+
+    Returns:
+        Dict with the same keys as BeaconScraper._search_parcel, except that
+        owner_address_text/parcel_address_text hold the unparsed addresses;
+        None if the page has no property data
+    """
+    tree = HTMLParser(html)
+
+    legal_description = _text(tree, 'span[id*="lblLegalDescription"], span[id*="LegalDescription"]')
+
+    owner_name = ''
+    for selector in OWNER_SELECTORS:
+        text = _text(tree, selector)
+        # Owner names typically start with letters, addresses with numbers
+        if text and not text[0].isdigit():
+            owner_name = text
+            break
+
+    if not legal_description and not owner_name:
+        return None
+
+    data = {
+        'parcel_id_display': _text(tree, 'span[id*="lblParcelID"], span[id*="lblParcel"]'),
+        'alternate_id': _text(tree, 'span[id*="lblAlternateID"], span[id*="lblAltID"], span[id*="AlternateID"]'),
+        'owner_name': owner_name,
+        'owner_address_text': _text(tree, 'span[id*="lblOwnerAddress"], span[id*="OwnerAddress"]'),
+        'parcel_address_text': _text(tree, 'span[id*="lblPropertyAddress"], span[id*="lblSitusAddress"], span[id*="lblLocation"]'),
+        'legal_description': legal_description,
+        'latest_deed_date': '',
+        'document_number': '',
+        'deed_code': '',
+        'prc_url': None
+    }
+
+    # Transfer history (latest deed is the first row)
+    table = tree.css_first('table[id*="gvwTransferHistory"], table[id*="TransferHistory"]')
+    first_row = table.css_first('tbody tr') if table else None
+    if first_row:
+        cells = first_row.css('th, td')
+        tds = first_row.css('td')
+        if cells:
+            data['latest_deed_date'] = cells[0].text().strip()
+        if len(tds) > 2:
+            data['document_number'] = tds[2].text().strip()
+        if len(tds) > 1:
+            code_text = tds[1].text().strip()
+            # Deed codes are 2-3 letters (WD, QC, ...)
+            if len(code_text) <= 3 and code_text.isalpha():
+                data['deed_code'] = code_text
+
+    # Most recent Property Record Card link
+    latest_href = None
+    latest_year = 0
+    for link in tree.css('a'):
+        link_text = link.text()
+        if 'Property Record Card' not in link_text or not link.attributes.get('href'):
+            continue
+        year_match = re.search(r'(\d{4})', link_text)
+        year = int(year_match.group(1)) if year_match else 0
+        if latest_href is None or year > latest_year:
+            latest_year = year
+            latest_href = link.attributes['href']
+
+    if latest_href:
+        prc_href = _absolute(latest_href, page_url)
+        # Some counties link the property page itself rather than a PDF
+        if 'PageTypeID=4' not in prc_href and 'Application.aspx' not in prc_href:
+            data['prc_url'] = prc_href
+    else:
+        pdf_link = tree.css_first('a[href*=".pdf"]')
+        if pdf_link:
+            prc_href = _absolute(pdf_link.attributes['href'], page_url)
+            if 'PageTypeID' not in prc_href:
+                data['prc_url'] = prc_href
+
+    return data
+
+
+async def fetch_parcel_http2(parcel_id: str, session: httpx.AsyncClient, template_url: str) -> Optional[Dict]:
+    """
+    Fetch and parse one parcel's property page without a browser
+
+    Args:
+        parcel_id: Parcel ID to look up
+        session: Client from create_http_client()
+        template_url: Property page URL of a parcel already found in the browser
+
+    Returns:
+        Parsed parcel data (see parse_property_page), or None if the page
+        could not be fetched or lacks the expected fields
+    """
+    url = property_url_for(template_url, parcel_id)
+    if not url:
+        return None
+
+    try:
+        response = await session.get(url)
+    except httpx.HTTPError as e:
+        print(f"  HTTP fetch failed for {parcel_id}: {e}")
+        return None
+
+    if response.status_code != 200 or "PageTypeID=4" not in str(response.url):
+        return None
+
+    return parse_property_page(response.text, str(response.url))
@@ -5,20 +5,55 @@ Handles scraping from beacon.schneidercorp.com portals across multiple counties.
 Uses flexible selectors to adapt to county-specific variations in element IDs.
 """
 from scrapers.base_scraper import BaseScraper
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, Optional, List
 import os
 import tempfile
 import time
 import random
 import re
+import json
+import asyncio
 import requests
 from urllib.parse import urlparse, parse_qs
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+from scrapers.browser_pool import get_pool
+from scrapers.beacon_http import create_http_client, fetch_parcel_http2
+from utils.rate_limit import scraper_page_bucket
 import openpyxl
 from openpyxl.styles import Font, Alignment, PatternFill
 from datetime import datetime
 
 
+# Parcels searched at once (one page each, sharing a single pooled browser context)
+MAX_CONCURRENT_PARCELS = 5
+
+# Event-driven waits (replace fixed sleeps; each returns as soon as the page is ready)
+SEARCH_INPUT_SELECTOR = 'input#topSearchControl, input[id*="txtParcelID"], input[type="search"]'
+SEARCH_INPUT_TIMEOUT_MS = 5_000
+AUTOCOMPLETE_TIMEOUT_MS = 6_000
+PROPERTY_PAGE_TIMEOUT_MS = 10_000
+
+# Cookies/localStorage saved after accepting Beacon's terms, reused across restarts
+CONSENT_STATE_PATH = os.path.join(tempfile.gettempdir(), "parcel_scraper_cache", "beacon_state.json")
+CONSENT_STATE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Request types the scraper never needs (map tiles alone are dozens of images).
+# Stylesheets stay: visibility checks on the search box and typeahead depend on them.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+# Returns text and href for each matched link (one CDP call instead of two per link)
+LINK_TEXT_HREF_JS = "els => els.map(e => ({text: e.innerText || '', href: e.getAttribute('href') || ''}))"
+
+
+async def block_heavy_resources(route) -> None:
+    """Playwright route handler that aborts images, media and fonts"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 class BeaconScraper(BaseScraper):
     """Scraper for Beacon (Schneider) platform"""
     
@@ -44,8 +79,8 @@ class BeaconScraper(BaseScraper):
         1. Parse parcel IDs from input file
         2. Extract AppID and LayerID from base_url
         3. Open browser and navigate to Beacon
-        4. For each parcel: search, extract data
-        5. Save to Excel with progress tracking
+        4. Search parcels concurrently (bounded), extract data and download PRCs
+        5. Save to Excel
         
         Args:
             parcel_file_path: Path to file with parcel IDs
@@ -81,6 +116,17 @@ class BeaconScraper(BaseScraper):
         pdfs_dir = os.path.join(output_dir, "property_cards")
         os.makedirs(pdfs_dir, exist_ok=True)
         
+        # Search all parcels on the shared browser pool's event loop
+        results = get_pool().run(
+            self.scrape_parcels_batch(
+                parcel_ids,
+                search_url,
+                job_id,
+                pdfs_dir,
+                progress_callback=progress_callback
+            )
+        )
+        
         # Create Excel workbook
         excel_path = os.path.join(output_dir, f"{county}_beacon_data.xlsx")
         wb = self._create_excel_template(county)
@@ -90,6 +136,85 @@ class BeaconScraper(BaseScraper):
         processed = 0
         failed = 0
         
+        for row_num, (parcel_id, parcel_data) in enumerate(zip(parcel_ids, results), start=3):  # Data starts at row 3 (1-indexed)
+            ws.cell(row_num, 1, parcel_id)  # Column A: Parcel ID
+            
+            if parcel_data is None:
+                # Parcel not found
+                ws.cell(row_num, 17, 'NOT_FOUND')
+                failed += 1
+            elif 'error' in parcel_data:
+                ws.cell(row_num, 17, f"ERROR: {parcel_data['error'][:50]}")
+                failed += 1
+            else:
+                ws.cell(row_num, 2, parcel_data.get('alternate_id', ''))  # Column B: Alternate ID
+                ws.cell(row_num, 3, parcel_data.get('owner_name', ''))  # Column C: Owner Name
+                ws.cell(row_num, 4, parcel_data.get('owner_address', ''))  # Column D: Owner Address
+                ws.cell(row_num, 5, parcel_data.get('owner_city', ''))  # Column E: Owner City
+                ws.cell(row_num, 6, parcel_data.get('owner_state', ''))  # Column F: Owner State
+                ws.cell(row_num, 7, parcel_data.get('owner_zip', ''))  # Column G: Owner Zip
+                ws.cell(row_num, 8, parcel_data.get('parcel_address', ''))  # Column H: Parcel Address
+                ws.cell(row_num, 9, parcel_data.get('parcel_city', ''))  # Column I: Parcel City
+                ws.cell(row_num, 10, parcel_data.get('parcel_state', ''))  # Column J: Parcel State
+                ws.cell(row_num, 11, parcel_data.get('parcel_zip', ''))  # Column K: Parcel Zip
+                ws.cell(row_num, 12, parcel_data.get('legal_description', ''))  # Column L: Legal Desc
+                ws.cell(row_num, 13, parcel_data.get('latest_deed_date', ''))  # Column M: Deed Date
+                ws.cell(row_num, 14, parcel_data.get('document_number', ''))  # Column N: Doc #
+                ws.cell(row_num, 15, parcel_data.get('deed_code', ''))  # Column O: Deed Type
+                ws.cell(row_num, 16, parcel_data.get('prc_path', ''))  # Column P: Report Card Path
+                ws.cell(row_num, 17, 'SUCCESS')  # Column Q: Status
+                processed += 1
+        
+        # Final save
+        wb.save(excel_path)
+        
+        print(f"\nBeacon Scraper: Complete!")
+        print(f"  Processed: {processed}/{total_parcels}")
+        print(f"  Failed: {failed}")
+        print(f"  Excel: {excel_path}")
+        print(f"  PDFs: {pdfs_dir}")
+        
+        return {
+            "excel_path": excel_path,
+            "pdfs_dir": pdfs_dir,
+            "total": total_parcels,
+            "processed": processed,
+            "failed": failed
+        }
+    
+    async def scrape_parcels_batch(
+        self,
+        parcel_ids: List[str],
+        search_url: str,
+        job_id: str,
+        pdfs_dir: str,
+        max_concurrency: int = MAX_CONCURRENT_PARCELS,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Optional[Dict]]:
+        """
+        Search parcels concurrently with a bounded number of in-flight pages
+        
+        Must run on the browser pool's loop (see get_pool().run). One pooled
+        context is shared by the whole batch; each concurrency slot owns a
+        page that stays on the search form between parcels, so only the first
+        visit per slot pays the cold navigation.
+        
+        Args:
+            parcel_ids: Parcel IDs to search for
+            search_url: URL of the search page (PageTypeID=2)
+            job_id: Job ID (used for debug screenshots)
+            pdfs_dir: Directory to save Property Record Cards in
+            max_concurrency: Maximum number of parcels searched at once
+            progress_callback: Function to report progress
+            
+        Returns:
+            List aligned with parcel_ids: parcel data dict (with prc_path),
+            None if not found, or {'error': message} if processing failed
+        """
+        total_parcels = len(parcel_ids)
+        completed = 0
+        progress_lock = asyncio.Lock()
+        
         # Create requests session for PDF downloads
         session = requests.Session()
         session.headers.update({
@@ -99,208 +224,255 @@ class BeaconScraper(BaseScraper):
             "Connection": "keep-alive",
         })
         
-        # Launch browser (headless mode with args to avoid detection)
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox'
-                ]
-            )
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
-            
+        # Borrow a context from the already-running browser (launched on first use)
+        pool = get_pool()
+        context = await pool.acquire()
+        
+        # Restore a recent terms agreement so pages skip the Agree round-trip
+        consent_cookies = self._load_consent_cookies()
+        if consent_cookies:
             try:
-                # Navigate to Beacon portal (use search page URL)
-                print(f"Navigating to: {search_url}")
-                page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-                
-                # Wait a bit for page to settle (don't wait for networkidle - Beacon has background activity)
-                page.wait_for_timeout(3000)
+                await context.add_cookies(consent_cookies)
+            except Exception as e:
+                print(f"Could not restore saved terms agreement: {e}")
+        
+        # Once the browser has found one parcel, its property page URL lets the
+        # rest be fetched over plain HTTP (Playwright remains the fallback)
+        http = create_http_client()
+        property_template = None
+        
+        # Idle search pages; its size is what bounds concurrency
+        pages = asyncio.Queue()
+        for _ in range(max(1, min(max_concurrency, total_parcels))):
+            pages.put_nowait(None)
+        
+        async def process(idx: int, parcel_id: str) -> Optional[Dict]:
+            nonlocal completed, property_template
+            page = await pages.get()
+            try:
+                await scraper_page_bucket.acquire_async()
+                print(f"Processing {idx}/{total_parcels}: {parcel_id}")
                 
-                # Check if we got an error page
-                if "Something went wrong" in page.content():
-                    print("Error page detected, retrying...")
-                    page.reload(wait_until="domcontentloaded")
-                    page.wait_for_timeout(3000)
+                parcel_data = None
+                if property_template:
+                    http_data = await fetch_parcel_http2(parcel_id, http, property_template)
+                    if http_data is not None:
+                        parcel_data = self._from_http_data(parcel_id, http_data)
+                        print(f"  ✓ Fetched property page over HTTP")
                 
-                # Click "Agree" or "Accept" button if present (terms and conditions)
-                print("Checking for terms agreement...")
-                agreement_clicked = False
-                try:
-                    # Try multiple variations of agree/accept buttons
-                    agree_selectors = [
-                        'text=Agree',
-                        'text=Accept',
-                        'button:has-text("Agree")',
-                        'button:has-text("Accept")',
-                        'input[value*="Agree"]',
-                        'input[value*="Accept"]'
-                    ]
-                    
-                    for selector in agree_selectors:
+                if parcel_data is None:
+                    if page is None:
+                        # First browser search for this slot: open its page on the search form
+                        page = await context.new_page()
+                        await page.route("**/*", block_heavy_resources)
                         try:
-                            button = page.locator(selector).first
-                            if button.is_visible(timeout=3000):
-                                print(f"Found agreement button: {selector}")
-                                button.click()
-                                agreement_clicked = True
-                                # Wait for navigation/reload after clicking agree
-                                page.wait_for_timeout(5000)
-                                print("Clicked terms agreement button")
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    print(f"No agreement button found or error: {e}")
-                    pass  # No agree button, continue
+                            await self._open_search_page(page, search_url, job_id)
+                        except Exception:
+                            # Let the next parcel in this slot retry with a fresh page
+                            await page.close()
+                            page = None
+                            raise
+                    
+                    # Search for parcel and extract data
+                    parcel_data = await self._search_parcel(page, parcel_id, search_url)
+                    
+                    if parcel_data and not property_template and parcel_data.get('property_url'):
+                        property_template = parcel_data['property_url']
+                        # Carry the terms-agreement cookies over to the HTTP client
+                        for cookie in await context.cookies():
+                            http.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
                 
-                # If we clicked agreement, we might need to navigate back to search page
-                if agreement_clicked:
-                    print("Re-navigating to search page after agreement...")
-                    page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-                    page.wait_for_timeout(3000)
+                # Download PRC PDF if available
+                if parcel_data is not None:
+                    parcel_data['prc_path'] = ''
+                    if parcel_data.get('prc_url'):
+                        try:
+                            # Create filename: {parcel_id}_{owner_stub}.pdf
+                            owner_stub = self._owner_filename_stub(parcel_data.get('owner_name', 'Unknown'))
+                            pdf_filename = self._safe_filename(f"{parcel_id}_{owner_stub}.pdf")
+                            prc_full_path = os.path.join(pdfs_dir, pdf_filename)
+                            
+                            # Download PRC with polite delay (blocking, so off the event loop)
+                            await asyncio.to_thread(self._download_prc, session, parcel_data['prc_url'], prc_full_path)
+                            parcel_data['prc_path'] = prc_full_path
+                            print(f"  ✓ Downloaded PRC: {pdf_filename}")
+                        except Exception as e:
+                            print(f"  ✗ Failed to download PRC: {e}")
+                            import traceback
+                            traceback.print_exc()
+                            parcel_data['prc_path'] = f"ERROR: {str(e)[:50]}"
                 
-                # Wait for search input to be available
-                # Try multiple possible selectors (Beacon has different versions)
-                print("Waiting for search input to be ready...")
-                search_input_found = False
-                search_selectors = [
-                    'input#topSearchControl',  # New Beacon interface
-                    'input[id*="txtParcelID"]',  # Old Beacon interface
-                    'input[type="search"]'  # Generic search input
-                ]
+                result = parcel_data
                 
-                for selector in search_selectors:
-                    try:
-                        page.wait_for_selector(selector, state="visible", timeout=5000)
-                        print(f"Search input found: {selector}")
-                        search_input_found = True
+            except Exception as e:
+                print(f"Error processing {parcel_id}: {e}")
+                import traceback
+                traceback.print_exc()
+                result = {'error': str(e)}
+            
+            # Report progress
+            async with progress_lock:
+                completed += 1
+                done = completed
+                if progress_callback:
+                    progress_callback(done, total_parcels)
+            
+            # Polite delay before this slot picks up the next parcel (3-7 seconds)
+            await asyncio.sleep(random.uniform(*self.page_delay_range))
+            
+            # Extra "thinking pause" every 15 parcels (10-15 seconds)
+            if done % 15 == 0 and done < total_parcels:
+                thinking_pause = random.uniform(10, 15)
+                print(f"  💭 Taking a thinking pause ({thinking_pause:.1f}s)...")
+                await asyncio.sleep(thinking_pause)
+            
+            pages.put_nowait(page)
+            return result
+        
+        try:
+            # gather keeps results in parcel order
+            return await asyncio.gather(*(
+                process(idx, parcel_id)
+                for idx, parcel_id in enumerate(parcel_ids, start=1)
+            ))
+        finally:
+            await http.aclose()
+            await pool.release(context)
+    
+    async def _wait_for_search_input(self, page, timeout: int = SEARCH_INPUT_TIMEOUT_MS) -> None:
+        """Wait until any known search input is visible (gives up quietly on timeout)"""
+        try:
+            await page.wait_for_selector(SEARCH_INPUT_SELECTOR, state="visible", timeout=timeout)
+        except PlaywrightTimeout:
+            pass
+    
+    async def _wait_for_property_page(self, page) -> None:
+        """Wait for navigation to a property page (gives up quietly on timeout)"""
+        try:
+            await page.wait_for_url(lambda url: "PageTypeID=4" in url, timeout=PROPERTY_PAGE_TIMEOUT_MS)
+        except PlaywrightTimeout:
+            pass
+    
+    def _load_consent_cookies(self) -> List[Dict]:
+        """Cookies from the saved terms agreement, or [] if missing or older than a day"""
+        try:
+            if time.time() - os.path.getmtime(CONSENT_STATE_PATH) > CONSENT_STATE_MAX_AGE_SECONDS:
+                return []
+            with open(CONSENT_STATE_PATH, 'r') as f:
+                return json.load(f).get('cookies', [])
+        except (OSError, ValueError):
+            return []
+    
+    def _from_http_data(self, parcel_id: str, http_data: Dict) -> Dict:
+        """Fill in the address components for data parsed by beacon_http"""
+        data = dict(http_data)
+        data['parcel_id_display'] = data['parcel_id_display'] or parcel_id
+        
+        for prefix in ('owner', 'parcel'):
+            addr_parts = self._parse_address(data.pop(f'{prefix}_address_text'))
+            data[f'{prefix}_address'] = addr_parts.get('street', '')
+            data[f'{prefix}_city'] = addr_parts.get('city', '')
+            data[f'{prefix}_state'] = addr_parts.get('state', '')
+            data[f'{prefix}_zip'] = addr_parts.get('zip', '')
+        
+        return data
+    
+    async def _open_search_page(self, page, search_url: str, job_id: str) -> None:
+        """
+        Navigate to the search page, accept the terms and wait for the search input
+        
+        Args:
+            page: Playwright page object
+            search_url: URL of the search page (PageTypeID=2)
+            job_id: Job ID (used for debug screenshots)
+        """
+        # Navigate to Beacon portal (use search page URL)
+        print(f"Navigating to: {search_url}")
+        await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
+        
+        # Wait for the page to settle (don't wait for networkidle - Beacon has background activity)
+        await self._wait_for_search_input(page)
+        
+        # Check if we got an error page
+        if "Something went wrong" in await page.content():
+            print("Error page detected, retrying...")
+            await page.reload(wait_until="domcontentloaded")
+            await self._wait_for_search_input(page)
+        
+        # Click "Agree" or "Accept" button if present (terms and conditions)
+        print("Checking for terms agreement...")
+        agreement_clicked = False
+        try:
+            # Try multiple variations of agree/accept buttons
+            agree_selectors = [
+                'text=Agree',
+                'text=Accept',
+                'button:has-text("Agree")',
+                'button:has-text("Accept")',
+                'input[value*="Agree"]',
+                'input[value*="Accept"]'
+            ]
+            
+            for selector in agree_selectors:
+                try:
+                    button = page.locator(selector).first
+                    if await button.is_visible(timeout=3000):
+                        print(f"Found agreement button: {selector}")
+                        await button.click()
+                        agreement_clicked = True
+                        # Wait for navigation/reload after clicking agree
+                        await page.wait_for_load_state("domcontentloaded")
+                        print("Clicked terms agreement button")
                         break
-                    except:
-                        continue
-                
-                if not search_input_found:
-                    print(f"ERROR: Search input not found with any selector")
-                    print(f"Current URL: {page.url}")
-                    print(f"Page title: {page.title()}")
-                    # Save screenshot for debugging
-                    try:
-                        screenshot_path = f"/tmp/beacon_debug_{job_id}.png"
-                        page.screenshot(path=screenshot_path)
-                        print(f"Screenshot saved to: {screenshot_path}")
-                    except:
-                        pass
-                    raise Exception("Search input not found on page")
-                
-                # Process each parcel
-                for idx, parcel_id in enumerate(parcel_ids, start=1):
-                    row_num = idx + 2  # Data starts at row 3 (1-indexed)
-                    
-                    try:
-                        print(f"Processing {idx}/{total_parcels}: {parcel_id}")
-                        
-                        # Search for parcel and extract data
-                        parcel_data = self._search_parcel(page, parcel_id, search_url)
-                        
-                        if parcel_data:
-                            # Write to Excel
-                            ws.cell(row_num, 1, parcel_id)  # Column A: Parcel ID
-                            ws.cell(row_num, 2, parcel_data.get('alternate_id', ''))  # Column B: Alternate ID
-                            ws.cell(row_num, 3, parcel_data.get('owner_name', ''))  # Column C: Owner Name
-                            ws.cell(row_num, 4, parcel_data.get('owner_address', ''))  # Column D: Owner Address
-                            ws.cell(row_num, 5, parcel_data.get('owner_city', ''))  # Column E: Owner City
-                            ws.cell(row_num, 6, parcel_data.get('owner_state', ''))  # Column F: Owner State
-                            ws.cell(row_num, 7, parcel_data.get('owner_zip', ''))  # Column G: Owner Zip
-                            ws.cell(row_num, 8, parcel_data.get('parcel_address', ''))  # Column H: Parcel Address
-                            ws.cell(row_num, 9, parcel_data.get('parcel_city', ''))  # Column I: Parcel City
-                            ws.cell(row_num, 10, parcel_data.get('parcel_state', ''))  # Column J: Parcel State
-                            ws.cell(row_num, 11, parcel_data.get('parcel_zip', ''))  # Column K: Parcel Zip
-                            ws.cell(row_num, 12, parcel_data.get('legal_description', ''))  # Column L: Legal Desc
-                            ws.cell(row_num, 13, parcel_data.get('latest_deed_date', ''))  # Column M: Deed Date
-                            ws.cell(row_num, 14, parcel_data.get('document_number', ''))  # Column N: Doc #
-                            ws.cell(row_num, 15, parcel_data.get('deed_code', ''))  # Column O: Deed Type
-                            
-                            # Download PRC PDF if available
-                            prc_path = ''
-                            if parcel_data.get('prc_url'):
-                                try:
-                                    # Create filename: {parcel_id}_{owner_stub}.pdf
-                                    owner_stub = self._owner_filename_stub(parcel_data.get('owner_name', 'Unknown'))
-                                    pdf_filename = self._safe_filename(f"{parcel_id}_{owner_stub}.pdf")
-                                    prc_full_path = os.path.join(pdfs_dir, pdf_filename)
-                                    
-                                    # Download PRC with polite delay
-                                    self._download_prc(session, parcel_data['prc_url'], prc_full_path)
-                                    prc_path = prc_full_path
-                                    print(f"  ✓ Downloaded PRC: {pdf_filename}")
-                                except Exception as e:
-                                    print(f"  ✗ Failed to download PRC: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                                    prc_path = f"ERROR: {str(e)[:50]}"
-                            
-                            ws.cell(row_num, 16, prc_path)  # Column P: Report Card Path
-                            ws.cell(row_num, 17, 'SUCCESS')  # Column Q: Status
-                            
-                            processed += 1
-                        else:
-                            # Parcel not found
-                            ws.cell(row_num, 1, parcel_id)
-                            ws.cell(row_num, 17, 'NOT_FOUND')
-                            failed += 1
-                        
-                        # Save progress every 10 parcels
-                        if idx % 10 == 0:
-                            wb.save(excel_path)
-                            print(f"Progress saved: {processed} successful, {failed} failed")
-                        
-                        # Report progress
-                        if progress_callback:
-                            progress_callback(idx, total_parcels)
-                        
-                        # Polite delay between parcels (3-7 seconds)
-                        delay = random.uniform(*self.page_delay_range)
-                        time.sleep(delay)
-                        
-                        # Extra "thinking pause" every 15 parcels (10-15 seconds)
-                        if idx % 15 == 0 and idx < total_parcels:
-                            thinking_pause = random.uniform(10, 15)
-                            print(f"  💭 Taking a thinking pause ({thinking_pause:.1f}s)...")
-                            time.sleep(thinking_pause)
-                        
-                    except Exception as e:
-                        print(f"Error processing {parcel_id}: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        ws.cell(row_num, 1, parcel_id)
-                        ws.cell(row_num, 17, f'ERROR: {str(e)[:50]}')
-                        failed += 1
-                        continue
-                
-            finally:
-                browser.close()
+                except:
+                    continue
+        except Exception as e:
+            print(f"No agreement button found or error: {e}")
+            pass  # No agree button, continue
         
-        # Final save
-        wb.save(excel_path)
+        # If we clicked agreement, we might need to navigate back to search page
+        if agreement_clicked:
+            # Remember the agreement (also replaces a saved state that stopped working)
+            try:
+                os.makedirs(os.path.dirname(CONSENT_STATE_PATH), exist_ok=True)
+                await page.context.storage_state(path=CONSENT_STATE_PATH)
+            except Exception as e:
+                print(f"Could not save terms agreement state: {e}")
+            
+            print("Re-navigating to search page after agreement...")
+            await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
         
-        print(f"\nBeacon Scraper: Complete!")
-        print(f"  Processed: {processed}/{total_parcels}")
-        print(f"  Failed: {failed}")
-        print(f"  Excel: {excel_path}")
-        print(f"  PDFs: {pdfs_dir}")
+        # Wait for search input to be available
+        # Try multiple possible selectors (Beacon has different versions)
+        print("Waiting for search input to be ready...")
+        search_input_found = False
+        search_selectors = [
+            'input#topSearchControl',  # New Beacon interface
+            'input[id*="txtParcelID"]',  # Old Beacon interface
+            'input[type="search"]'  # Generic search input
+        ]
         
-        return {
-            "excel_path": excel_path,
-            "pdfs_dir": pdfs_dir,
-            "total": total_parcels,
-            "processed": processed,
-            "failed": failed
-        }
+        for selector in search_selectors:
+            try:
+                await page.wait_for_selector(selector, state="visible", timeout=5000)
+                print(f"Search input found: {selector}")
+                search_input_found = True
+                break
+            except:
+                continue
+        
+        if not search_input_found:
+            print(f"ERROR: Search input not found with any selector")
+            print(f"Current URL: {page.url}")
+            print(f"Page title: {await page.title()}")
+            # Save screenshot for debugging
+            try:
+                screenshot_path = f"/tmp/beacon_debug_{job_id}.png"
+                await page.screenshot(path=screenshot_path)
+                print(f"Screenshot saved to: {screenshot_path}")
+            except:
+                pass
+            raise Exception("Search input not found on page")
     
     def _extract_url_params(self, url: str) -> Dict[str, str]:
         """Extract AppID, LayerID, PageTypeID, PageID from Beacon URL"""
@@ -365,7 +537,7 @@ class BeaconScraper(BaseScraper):
         
         return result
     
-    def _search_parcel(self, page, parcel_id: str, search_url: str) -> Optional[Dict]:
+    async def _search_parcel(self, page, parcel_id: str, search_url: str) -> Optional[Dict]:
         """
         Search for a parcel and extract data using flexible selectors
         
@@ -389,7 +561,7 @@ class BeaconScraper(BaseScraper):
             for selector in search_selectors:
                 try:
                     temp_input = page.locator(selector).first
-                    if temp_input.is_visible(timeout=2000):
+                    if await temp_input.is_visible(timeout=2000):
                         search_input = temp_input
                         print(f"  Using search input: {selector}")
                         break
@@ -403,13 +575,13 @@ class BeaconScraper(BaseScraper):
                 # Check if we're on the right page
                 if "PageTypeID=2" not in page.url:
                     print("WARNING: Not on search page! Navigating...")
-                    page.goto(search_url, wait_until="domcontentloaded")
-                    page.wait_for_timeout(3000)
+                    await page.goto(search_url, wait_until="domcontentloaded")
+                    await self._wait_for_search_input(page)
                     # Try again
                     for selector in search_selectors:
                         try:
                             temp_input = page.locator(selector).first
-                            if temp_input.is_visible(timeout=2000):
+                            if await temp_input.is_visible(timeout=2000):
                                 search_input = temp_input
                                 break
                         except:
@@ -419,11 +591,8 @@ class BeaconScraper(BaseScraper):
                     raise Exception("Search input not found with any selector")
             
             # Clear and fill search box
-            search_input.clear(timeout=5000)
-            search_input.fill(parcel_id, timeout=5000)
-            
-            # Wait for autocomplete dropdown to appear (give it more time)
-            page.wait_for_timeout(3000)
+            await search_input.clear(timeout=5000)
+            await search_input.fill(parcel_id, timeout=5000)
             
             # Look for autocomplete results (Twitter Typeahead)
             # The dropdown shows matching parcels - we need to click on one
@@ -434,15 +603,15 @@ class BeaconScraper(BaseScraper):
                 # Try exact match first, then partial match
                 suggestion = None
                 
-                # Try exact match
+                # Try exact match (waits for the autocomplete dropdown to appear)
                 try:
                     suggestion = page.locator(f'.tt-suggestion:has-text("{parcel_id}")').first
-                    suggestion.wait_for(state="visible", timeout=3000)
+                    await suggestion.wait_for(state="visible", timeout=AUTOCOMPLETE_TIMEOUT_MS)
                 except:
                     # Try partial match - look for any suggestion containing part of the parcel ID
                     try:
                         # Get all suggestions
-                        suggestions = page.locator('.tt-suggestion').all()
+                        suggestions = await page.locator('.tt-suggestion').all()
                         if suggestions:
                             # Click the first one (most relevant)
                             suggestion = suggestions[0]
@@ -452,11 +621,11 @@ class BeaconScraper(BaseScraper):
                 
                 if suggestion:
                     print(f"  ✓ Found autocomplete suggestion, clicking...")
-                    suggestion.click()
+                    await suggestion.click()
                     autocomplete_success = True
                     
                     # Wait for navigation to property page (PageTypeID=4)
-                    page.wait_for_timeout(5000)
+                    await self._wait_for_property_page(page)
                     
                     # Debug: Check current URL
                     current_url = page.url
@@ -477,8 +646,8 @@ class BeaconScraper(BaseScraper):
             if not autocomplete_success:
                 print(f"  Trying direct search submission...")
                 try:
-                    search_input.press("Enter")
-                    page.wait_for_timeout(5000)
+                    await search_input.press("Enter")
+                    await self._wait_for_property_page(page)
                     
                     # Check if we got to a property page
                     if "PageTypeID=4" in page.url:
@@ -490,7 +659,7 @@ class BeaconScraper(BaseScraper):
             # If still no success, give up
             if not autocomplete_success:
                 print(f"  ✗ Could not find parcel {parcel_id}")
-                page.goto(search_url)
+                await page.goto(search_url)
                 return None
             
             # Check if we got results or "no results" message
@@ -499,7 +668,7 @@ class BeaconScraper(BaseScraper):
             try:
                 # Try to find legal description (indicates we found the parcel)
                 legal_desc_elem = page.locator('span[id*="lblLegalDescription"], span[id*="LegalDescription"]').first
-                legal_desc_elem.wait_for(timeout=3000)
+                await legal_desc_elem.wait_for(timeout=3000)
                 print(f"  ✓ Found legal description element")
                 property_found = True
             except:
@@ -508,14 +677,14 @@ class BeaconScraper(BaseScraper):
                 try:
                     # Try to find owner name element as alternate indicator
                     owner_elem = page.locator('a[id*="lnkOwnerName"], a[id*="OwnerName"], span[id*="lblOwner"], span[id*="Owner"]').first
-                    owner_elem.wait_for(timeout=3000)
+                    await owner_elem.wait_for(timeout=3000)
                     print(f"  ✓ Found owner element instead")
                     property_found = True
                 except:
                     # Try to find parcel ID element
                     try:
                         parcel_elem = page.locator('span[id*="lblParcelID"], span[id*="lblParcel"], span[id*="ParcelID"]').first
-                        parcel_elem.wait_for(timeout=3000)
+                        await parcel_elem.wait_for(timeout=3000)
                         print(f"  ✓ Found parcel ID element")
                         property_found = True
                     except:
@@ -529,18 +698,18 @@ class BeaconScraper(BaseScraper):
                 # Debug: Save screenshot and HTML
                 try:
                     screenshot_path = os.path.join(tempfile.gettempdir(), f"beacon_debug_{parcel_id.replace('/', '_').replace('.', '_')}.png")
-                    page.screenshot(path=screenshot_path)
+                    await page.screenshot(path=screenshot_path)
                     print(f"  Debug screenshot saved: {screenshot_path}")
                     
                     # Also save HTML for inspection
                     html_path = os.path.join(tempfile.gettempdir(), f"beacon_debug_{parcel_id.replace('/', '_').replace('.', '_')}.html")
                     with open(html_path, 'w', encoding='utf-8') as f:
-                        f.write(page.content())
+                        f.write(await page.content())
                     print(f"  Debug HTML saved: {html_path}")
                 except:
                     pass
                 
-                page.goto(search_url)  # Go back to search page
+                await page.goto(search_url)  # Go back to search page
                 return None
             
             # Extract data
@@ -550,14 +719,14 @@ class BeaconScraper(BaseScraper):
             try:
                 # Try to find parcel ID on the page
                 parcel_id_elem = page.locator('span[id*="lblParcelID"], span[id*="lblParcel"]').first
-                data['parcel_id_display'] = parcel_id_elem.inner_text(timeout=2000).strip()
+                data['parcel_id_display'] = (await parcel_id_elem.inner_text(timeout=2000)).strip()
             except:
                 data['parcel_id_display'] = parcel_id
             
             try:
                 # Try to find alternate ID
                 alt_id_elem = page.locator('span[id*="lblAlternateID"], span[id*="lblAltID"], span[id*="AlternateID"]').first
-                data['alternate_id'] = alt_id_elem.inner_text(timeout=2000).strip()
+                data['alternate_id'] = (await alt_id_elem.inner_text(timeout=2000)).strip()
             except:
                 data['alternate_id'] = ''
             
@@ -577,7 +746,7 @@ class BeaconScraper(BaseScraper):
                 for selector in owner_selectors:
                     try:
                         elem = page.locator(selector).first
-                        text = elem.inner_text(timeout=1000).strip()
+                        text = (await elem.inner_text(timeout=1000)).strip()
                         if text and len(text) > 0:
                             # Make sure it's not an address (addresses usually have numbers at start)
                             # Owner names typically start with letters
@@ -595,7 +764,7 @@ class BeaconScraper(BaseScraper):
             try:
                 # Try to find owner address - usually in a span with "Address" in the ID
                 owner_addr_elem = page.locator('span[id*="lblOwnerAddress"], span[id*="OwnerAddress"]').first
-                owner_addr_text = owner_addr_elem.inner_text(timeout=2000).strip()
+                owner_addr_text = (await owner_addr_elem.inner_text(timeout=2000)).strip()
                 
                 # Parse address into components
                 # Format is usually: "123 Main St, City, ST 12345" or multiple lines
@@ -614,7 +783,7 @@ class BeaconScraper(BaseScraper):
             try:
                 # Try to find parcel/property address
                 parcel_addr_elem = page.locator('span[id*="lblPropertyAddress"], span[id*="lblSitusAddress"], span[id*="lblLocation"]').first
-                parcel_addr_text = parcel_addr_elem.inner_text(timeout=2000).strip()
+                parcel_addr_text = (await parcel_addr_elem.inner_text(timeout=2000)).strip()
                 
                 # Parse address into components
                 addr_parts = self._parse_address(parcel_addr_text)
@@ -630,7 +799,7 @@ class BeaconScraper(BaseScraper):
             
             # Legal description
             try:
-                data['legal_description'] = legal_desc_elem.inner_text().strip()
+                data['legal_description'] = (await legal_desc_elem.inner_text()).strip()
             except:
                 data['legal_description'] = ''
             
@@ -644,17 +813,17 @@ class BeaconScraper(BaseScraper):
                 
                 # Date is usually in the first cell (th or td)
                 date_cell = first_row.locator('th, td').first
-                data['latest_deed_date'] = date_cell.inner_text(timeout=2000).strip()
+                data['latest_deed_date'] = (await date_cell.inner_text(timeout=2000)).strip()
                 
                 # Document number is usually in 3rd column
                 doc_cell = first_row.locator('td').nth(2)
-                data['document_number'] = doc_cell.inner_text(timeout=2000).strip()
+                data['document_number'] = (await doc_cell.inner_text(timeout=2000)).strip()
                 
                 # Deed code might be in another column (WD, QC, etc.)
                 # Try to find it
                 try:
                     code_cell = first_row.locator('td').nth(1)
-                    code_text = code_cell.inner_text(timeout=1000).strip()
+                    code_text = (await code_cell.inner_text(timeout=1000)).strip()
                     # Check if it looks like a deed code (2-3 letters)
                     if len(code_text) <= 3 and code_text.isalpha():
                         data['deed_code'] = code_text
@@ -673,7 +842,8 @@ class BeaconScraper(BaseScraper):
             # Look for the most recent PRC link - there may be multiple years
             try:
                 # Try to find PRC links - they usually have "Property Record Card" in the text
-                prc_links = page.locator('a:has-text("Property Record Card")').all()
+                # Text and href of every PRC link in one round-trip
+                prc_links = await page.locator('a:has-text("Property Record Card")').evaluate_all(LINK_TEXT_HREF_JS)
                 
                 if prc_links:
                     # If multiple PRCs, find the one with the most recent year
@@ -681,23 +851,21 @@ class BeaconScraper(BaseScraper):
                     latest_year = 0
                     
                     for link in prc_links:
-                        try:
-                            link_text = link.inner_text()
-                            # Extract year from text like "2024 Property Record Card (PDF)"
-                            year_match = re.search(r'(\d{4})', link_text)
-                            if year_match:
-                                year = int(year_match.group(1))
-                                if year > latest_year:
-                                    latest_year = year
-                                    latest_prc = link
-                            elif not latest_prc:
-                                # If no year found, use this as fallback
-                                latest_prc = link
-                        except:
+                        if not link['href']:
                             continue
+                        # Extract year from text like "2024 Property Record Card (PDF)"
+                        year_match = re.search(r'(\d{4})', link['text'])
+                        if year_match:
+                            year = int(year_match.group(1))
+                            if year > latest_year:
+                                latest_year = year
+                                latest_prc = link
+                        elif not latest_prc:
+                            # If no year found, use this as fallback
+                            latest_prc = link
                     
                     if latest_prc:
-                        prc_href = latest_prc.get_attribute('href')
+                        prc_href = latest_prc['href']
                         
                         # Make absolute URL if relative
                         if prc_href.startswith('/'):
@@ -721,9 +889,9 @@ class BeaconScraper(BaseScraper):
                         data['prc_url'] = None
                 else:
                     # Fallback: try generic PDF links (but not property page links)
-                    pdf_links = page.locator('a[href*=".pdf"]').all()
+                    pdf_links = await page.locator('a[href*=".pdf"]').all()
                     if pdf_links:
-                        prc_href = pdf_links[0].get_attribute('href')
+                        prc_href = await pdf_links[0].get_attribute('href')
                         if prc_href.startswith('/'):
                             base_domain = f"{urlparse(search_url).scheme}://{urlparse(search_url).netloc}"
                             prc_href = base_domain + prc_href
@@ -743,9 +911,12 @@ class BeaconScraper(BaseScraper):
                 print(f"Could not find PRC URL: {e}")
                 data['prc_url'] = None
             
+            # Remember where the property page lives (lets later parcels skip the browser)
+            data['property_url'] = page.url
+            
             # Go back to search page for next parcel
-            page.goto(search_url, wait_until="domcontentloaded")
-            page.wait_for_timeout(2000)
+            await page.goto(search_url, wait_until="domcontentloaded")
+            await self._wait_for_search_input(page)
             
             return data
             
@@ -755,8 +926,8 @@ class BeaconScraper(BaseScraper):
             traceback.print_exc()
             # Try to recover by going back to search page
             try:
-                page.goto(search_url, wait_until="domcontentloaded")
-                page.wait_for_timeout(2000)
+                await page.goto(search_url, wait_until="domcontentloaded")
+                await self._wait_for_search_input(page)
             except:
                 pass
             return None
@@ -0,0 +1,161 @@
+"""
+Shared Chromium pool for Playwright-based scrapers
+
+Launching Chromium costs 1-2 seconds, which used to be paid by every job.
+The pool starts one browser lazily and keeps it (plus a fixed set of
+browser contexts) alive for the life of the process. Playwright objects
+are bound to the event loop that created them, so the pool owns a
+background thread running a single long-lived loop and scrapers submit
+their coroutines to it with run().
+"""
+from typing import Optional
+import asyncio
+import sys
+import threading
+from config.settings import BROWSER_POOL_SIZE
+
+
+DEFAULT_POOL_SIZE = BROWSER_POOL_SIZE
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox'
+]
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+class BrowserPool:
+    """One headless Chromium plus a queue of reusable browser contexts"""
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE):
+        self.size = size
+        self._playwright = None
+        self._browser = None
+        self._contexts = None
+        self._start_lock = None
+
+        # Playwright needs subprocess support, which the selector loop lacks on Windows
+        if sys.platform == 'win32':
+            self._loop = asyncio.ProactorEventLoop()
+        else:
+            self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="BrowserPool", daemon=True)
+        self._thread.start()
+
+    def run(self, coro):
+        """
+        Run a coroutine on the pool's event loop and wait for its result
+
+        Args:
+            coro: Coroutine that may call acquire()/release()
+
+        Returns:
+            Whatever the coroutine returns
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def acquire(self):
+        """
+        Take a browser context from the pool, starting the browser on first use
+
+        Returns:
+            Playwright BrowserContext; hand it back with release()
+        """
+        await self._ensure_started()
+        return await self._contexts.get()
+
+    async def release(self, context) -> None:
+        """
+        Return a context to the pool, closing any pages left open
+
+        Args:
+            context: Context previously returned by acquire()
+        """
+        for page in list(context.pages):
+            try:
+                await page.close()
+            except Exception:
+                pass
+        # Contexts from a dead or relaunched browser are dropped; relaunching
+        # refills the queue so callers waiting in acquire() still get one
+        if context.browser is self._browser and self._browser.is_connected():
+            self._contexts.put_nowait(context)
+        elif self._playwright is not None:
+            await self._ensure_started()
+
+    async def _ensure_started(self) -> None:
+        """Start the browser on first use, or relaunch it if it has crashed"""
+        # Created here rather than in __init__ so they belong to the pool's loop
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+            self._contexts = asyncio.Queue()
+
+        async with self._start_lock:
+            if self._browser is None or not self._browser.is_connected():
+                await self._start()
+
+    async def _start(self) -> None:
+        """Launch (or relaunch after a crash) the browser and pre-create contexts"""
+        if self._playwright is None:
+            # Imported here so main.py can import shutdown_pool without loading Playwright at API startup
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+
+        print(f"Browser pool: launching Chromium with {self.size} contexts")
+        self._browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+        # Refill the same queue so coroutines already waiting on it are woken
+        while not self._contexts.empty():
+            self._contexts.get_nowait()
+        for _ in range(self.size):
+            self._contexts.put_nowait(await self._browser.new_context(user_agent=USER_AGENT))
+
+    async def _close(self) -> None:
+        """Close the browser and stop Playwright"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def shutdown(self) -> None:
+        """Close the browser and stop the pool's event loop thread"""
+        try:
+            self.run(self._close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(size: int = DEFAULT_POOL_SIZE) -> BrowserPool:
+    """
+    Get the process-wide browser pool, creating it on first call
+
+    Args:
+        size: Number of browser contexts (only used when the pool is created)
+
+    Returns:
+        Shared BrowserPool instance
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(size)
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Shut down the shared pool if it was ever started"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
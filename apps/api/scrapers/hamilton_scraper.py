@@ -26,6 +26,7 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 import openpyxl
 from openpyxl.styles import Font, Alignment, PatternFill
 from datetime import datetime
+from utils.rate_limit import scraper_page_bucket
 
 
 class HamiltonScraper(BaseScraper):
@@ -121,6 +122,7 @@ class HamiltonScraper(BaseScraper):
                         print(f"Processing {idx}/{total_parcels}: {parcel_id}")
                         
                         # Search for parcel and extract data
+                        scraper_page_bucket.acquire()
                         parcel_data = self._search_parcel(page, parcel_id, base_url)
                         
                         if parcel_data:
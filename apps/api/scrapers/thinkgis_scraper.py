@@ -14,6 +14,17 @@ from bs4 import BeautifulSoup
 import openpyxl
 import asyncio
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from scrapers.browser_pool import get_pool
+from scrapers.thinkgis_search import (
+    DEFAULT_LOOKUP_DELAY_RANGE,
+    RESULT_LINK_TIMEOUT_MS,
+    RESULT_SELECTOR,
+    PROPERTY_CARD_LINK_SELECTOR,
+    PREPARE_SEARCH_JS,
+    SEARCH_STARTED_JS,
+    SEARCH_DONE_JS
+)
+from utils.rate_limit import scraper_page_bucket
 
 
 # Politeness delays
@@ -198,6 +209,83 @@ def parse_parcel_info_from_search(info_html: str) -> Dict:
     return parcel_data
 
 
+async def _lookup_parcels_on_page(page, parcel_ids: List[str], browser_timeout_ms: int) -> Dict[str, Tuple[str, str, str]]:
+    """
+    Search each parcel on an open ThinkGIS map page and collect (dsid, feature_id, info_html)
+    """
+    results = {}
+    
+    for idx, parcel_id in enumerate(parcel_ids, 1):
+        print(f"[{idx}/{len(parcel_ids)}] Looking up {parcel_id}...")
+        
+        try:
+            await scraper_page_bucket.acquire_async()
+            
+            # Clear the previous parcel's result so it can't be mistaken for this one
+            await page.evaluate(PREPARE_SEARCH_JS)
+
+            # Search
+            # Playwright auto-waits for the box to be actionable, no fixed sleeps needed
+            box = page.locator('input#searchBox')
+            await box.click()
+            await box.fill("")  # Clear first
+            await box.fill(str(parcel_id).strip())
+            await box.press("Enter")
+            
+            # Make sure the page picked up the search, then wait for it to finish
+            try:
+                await page.wait_for_function(SEARCH_STARTED_JS, timeout=RESULT_LINK_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                print(f"  ⚠ Search did not start for {parcel_id}")
+                continue
+            try:
+                await page.wait_for_function(SEARCH_DONE_JS, timeout=browser_timeout_ms)
+            except PlaywrightTimeoutError:
+                print(f"  ⚠ Search timed out for {parcel_id}")
+                continue
+
+            # Wait for the Property Card link (or "no results") instead of a fixed sleep
+            try:
+                await page.wait_for_selector(RESULT_SELECTOR, state="attached", timeout=RESULT_LINK_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                pass
+
+            # Capture the info panel HTML (has all the parcel data!)
+            info_html = await page.locator('#infoWindow').inner_html()
+
+            # Get the Property Card link
+            prop_card_link = page.locator(PROPERTY_CARD_LINK_SELECTOR).first
+            
+            if await prop_card_link.count() == 0:
+                print(f"  ⚠ No Property Card link found for {parcel_id}")
+                continue
+            
+            href = await prop_card_link.get_attribute('href')
+            
+            # Extract DSID and FeatureID
+            dsid_match = re.search(r"DSID=(\d+)", href)
+            feature_match = re.search(r"FeatureID=(\d+)", href)
+            
+            if dsid_match and feature_match:
+                dsid = dsid_match.group(1)
+                feature_id = feature_match.group(1)
+                
+                results[parcel_id] = (dsid, feature_id, info_html)
+                print(f"  ✓ DSID={dsid}, FeatureID={feature_id}")
+            else:
+                print(f"  ⚠ Could not extract DSID/FeatureID from: {href}")
+        
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+            continue
+        
+        finally:
+            # Short politeness pause between lookups
+            await asyncio.sleep(random.uniform(*DEFAULT_LOOKUP_DELAY_RANGE))
+    
+    return results
+
+
 async def batch_lookup_parcels_async(parcel_ids: List[str], base_url: str, browser_timeout_ms: int = DEFAULT_BROWSER_TIMEOUT_MS, headless: bool = True) -> Dict[str, Tuple[str, str, str]]:
     """
     Open browser ONCE and look up all parcels, returning a map of parcel_id -> (dsid, feature_id, info_html).
@@ -205,8 +293,6 @@ async def batch_lookup_parcels_async(parcel_ids: List[str], base_url: str, brows
     
     Async version to work properly on Windows in background threads.
     """
-    results = {}
-    
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=headless)
         ctx = await browser.new_context()
@@ -216,62 +302,31 @@ async def batch_lookup_parcels_async(parcel_ids: List[str], base_url: str, brows
         await page.goto(base_url, wait_until="domcontentloaded")
         await asyncio.sleep(2)
         
-        for idx, parcel_id in enumerate(parcel_ids, 1):
-            print(f"[{idx}/{len(parcel_ids)}] Looking up {parcel_id}...")
-            
-            try:
-                # Search
-                box = page.locator('input#searchBox')
-                await box.click()
-                await asyncio.sleep(0.3)
-                await box.fill("")  # Clear first
-                await box.fill(str(parcel_id).strip())
-                await asyncio.sleep(0.3)
-                await box.press("Enter")
-                
-                # Wait for results
-                try:
-                    await page.wait_for_function(
-                        "() => !document.getElementById('infoWindow').innerText.includes('Searching...')",
-                        timeout=browser_timeout_ms
-                    )
-                except PlaywrightTimeoutError:
-                    pass
-                
-                await asyncio.sleep(1.5)
-                
-                # Get the Property Card link
-                prop_card_link = page.locator('a:has-text("Show Property Card")').first
-                
-                if await prop_card_link.count() == 0:
-                    print(f"  ⚠ No Property Card link found for {parcel_id}")
-                    continue
-                
-                href = await prop_card_link.get_attribute('href')
-                
-                # Extract DSID and FeatureID
-                dsid_match = re.search(r"DSID=(\d+)", href)
-                feature_match = re.search(r"FeatureID=(\d+)", href)
-                
-                if dsid_match and feature_match:
-                    dsid = dsid_match.group(1)
-                    feature_id = feature_match.group(1)
-                    
-                    # Capture the info panel HTML (has all the parcel data!)
-                    info_html = await page.locator('#infoWindow').inner_html()
-                    
-                    results[parcel_id] = (dsid, feature_id, info_html)
-                    print(f"  ✓ DSID={dsid}, FeatureID={feature_id}")
-                else:
-                    print(f"  ⚠ Could not extract DSID/FeatureID from: {href}")
-                
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                continue
-        
-        await browser.close()
+        try:
+            return await _lookup_parcels_on_page(page, parcel_ids, browser_timeout_ms)
+        finally:
+            await browser.close()
+
+
+async def batch_lookup_parcels_pooled(parcel_ids: List[str], base_url: str, browser_timeout_ms: int = DEFAULT_BROWSER_TIMEOUT_MS) -> Dict[str, Tuple[str, str, str]]:
+    """
+    Same as batch_lookup_parcels_async, but on a context from the shared
+    browser pool, so consecutive jobs don't each launch Chromium.
     
-    return results
+    Must run on the browser pool's loop (see get_pool().run).
+    """
+    pool = get_pool()
+    context = await pool.acquire()
+    try:
+        page = await context.new_page()
+        page.set_default_timeout(browser_timeout_ms)
+        
+        await page.goto(base_url, wait_until="domcontentloaded")
+        await asyncio.sleep(2)
+        
+        return await _lookup_parcels_on_page(page, parcel_ids, browser_timeout_ms)
+    finally:
+        await pool.release(context)
 
 
 def batch_lookup_parcels(parcel_ids: List[str], base_url: str, browser_timeout_ms: int = DEFAULT_BROWSER_TIMEOUT_MS, headless: bool = True) -> Dict[str, Tuple[str, str, str]]:
@@ -339,7 +394,10 @@ def batch_lookup_parcels(parcel_ids: List[str], base_url: str, browser_timeout_m
         return results
     
     else:
-        # On Linux, use async approach
+        # On Linux, use async approach; headless lookups share the process-wide browser
+        if headless:
+            return get_pool().run(batch_lookup_parcels_pooled(parcel_ids, base_url, browser_timeout_ms))
+        
         if sys.platform == 'win32':
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
         
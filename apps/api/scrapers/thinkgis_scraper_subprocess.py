@@ -6,7 +6,17 @@ import sys
 import json
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import time
+import random
 import re
+from thinkgis_search import (
+    DEFAULT_LOOKUP_DELAY_RANGE,
+    RESULT_LINK_TIMEOUT_MS,
+    RESULT_SELECTOR,
+    PROPERTY_CARD_LINK_SELECTOR,
+    PREPARE_SEARCH_JS,
+    SEARCH_STARTED_JS,
+    SEARCH_DONE_JS
+)
 
 
 def batch_lookup_parcels_subprocess(parcel_ids, base_url, browser_timeout_ms=35000):
@@ -29,28 +39,39 @@ def batch_lookup_parcels_subprocess(parcel_ids, base_url, browser_timeout_ms=350
             print(f"[{idx}/{len(parcel_ids)}] Looking up {parcel_id}...", file=sys.stderr)
             
             try:
+                # Clear the previous result so it isn't mistaken for this one
+                page.evaluate(PREPARE_SEARCH_JS)
+                
                 # Search
                 box = page.locator('input#searchBox')
                 box.click()
-                time.sleep(0.3)
                 box.fill("")
                 box.fill(str(parcel_id).strip())
-                time.sleep(0.3)
                 box.press("Enter")
                 
-                # Wait for results
+                # Make sure the page picked up the search, then wait for it to finish
+                try:
+                    page.wait_for_function(SEARCH_STARTED_JS, timeout=RESULT_LINK_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    print(f"  ⚠ Search did not start for {parcel_id}", file=sys.stderr)
+                    continue
+                try:
+                    page.wait_for_function(SEARCH_DONE_JS, timeout=browser_timeout_ms)
+                except PlaywrightTimeoutError:
+                    print(f"  ⚠ Search timed out for {parcel_id}", file=sys.stderr)
+                    continue
+                
+                # Wait for the Property Card link (or "no results") instead of a fixed sleep
                 try:
-                    page.wait_for_function(
-                        "() => !document.getElementById('infoWindow').innerText.includes('Searching...')",
-                        timeout=browser_timeout_ms
-                    )
+                    page.wait_for_selector(RESULT_SELECTOR, state="attached", timeout=RESULT_LINK_TIMEOUT_MS)
                 except PlaywrightTimeoutError:
                     pass
                 
-                time.sleep(1.5)
+                # Capture the info panel HTML
+                info_html = page.locator('#infoWindow').inner_html()
                 
                 # Get the Property Card link
-                prop_card_link = page.locator('a:has-text("Show Property Card")').first
+                prop_card_link = page.locator(PROPERTY_CARD_LINK_SELECTOR).first
                 
                 if prop_card_link.count() == 0:
                     print(f"  ⚠ No Property Card link found for {parcel_id}", file=sys.stderr)
@@ -66,9 +87,6 @@ def batch_lookup_parcels_subprocess(parcel_ids, base_url, browser_timeout_ms=350
                     dsid = dsid_match.group(1)
                     feature_id = feature_match.group(1)
                     
-                    # Capture the info panel HTML
-                    info_html = page.locator('#infoWindow').inner_html()
-                    
                     results[parcel_id] = {
                         "dsid": dsid,
                         "feature_id": feature_id,
@@ -81,6 +99,10 @@ def batch_lookup_parcels_subprocess(parcel_ids, base_url, browser_timeout_ms=350
             except Exception as e:
                 print(f"  ✗ Error: {e}", file=sys.stderr)
                 continue
+            
+            finally:
+                # Short politeness pause between lookups
+                time.sleep(random.uniform(*DEFAULT_LOOKUP_DELAY_RANGE))
         
         browser.close()
     
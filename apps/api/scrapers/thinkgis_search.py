@@ -0,0 +1,40 @@
+"""
+ThinkGIS search-box settings shared by ThinkGISScraper and the Windows
+subprocess script
+
+thinkgis_scraper_subprocess.py runs as a standalone script, so this
+module must not import anything from the app.
+"""
+
+DEFAULT_LOOKUP_DELAY_RANGE = (0.5, 1.0)  # seconds between search-box lookups
+RESULT_LINK_TIMEOUT_MS = 2_000  # max wait for the page to react to a search, and for the Property Card link once it ends
+
+# Property Card link of the current result, or the "no results" notice
+RESULT_SELECTOR = '#infoWindow a:has-text("Show Property Card"), #noResults'
+PROPERTY_CARD_LINK_SELECTOR = '#infoWindow a:has-text("Show Property Card")'
+
+# Clears the result panel and starts watching it just before a search is
+# submitted, so whatever shows up afterwards belongs to the new parcel.
+# Any change to #infoWindow or #noResults (including the "Searching..."
+# notice or re-showing "no results") marks the search as started.
+PREPARE_SEARCH_JS = """() => {
+    const info = document.getElementById('infoWindow');
+    const none = document.getElementById('noResults');
+    if (window.__parcelSearchObserver) window.__parcelSearchObserver.disconnect();
+    window.__parcelSearchStarted = false;
+    if (info) info.innerHTML = '';
+    const observer = new MutationObserver(() => { window.__parcelSearchStarted = true; });
+    const options = {childList: true, subtree: true, characterData: true, attributes: true};
+    if (info) observer.observe(info, options);
+    if (none) observer.observe(none, options);
+    window.__parcelSearchObserver = observer;
+}"""
+
+# True once the page has reacted to the submitted search
+SEARCH_STARTED_JS = "() => window.__parcelSearchStarted === true"
+
+# True once the "Searching..." notice is gone
+SEARCH_DONE_JS = """() => {
+    const info = document.getElementById('infoWindow');
+    return !(info && info.innerText.includes('Searching...'));
+}"""
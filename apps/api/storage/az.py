@@ -1,5 +1,13 @@
+import io
 import os
-from azure.storage.blob import (BlobServiceClient, ContentSettings, PublicAccess)
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import (BlobBlock, BlobServiceClient, ContentSettings, PublicAccess)
+from config.settings import AZURE_CONNECTION_STRING, WORKER_MAX_CONCURRENT_JOBS
+from utils.rate_limit import azure_ops_bucket
 
 MIME_MAP = {
     ".html": "text/html",
@@ -15,17 +23,117 @@ MIME_MAP = {
     ".jpeg": "image/jpeg",
 }
 
+# Max blobs per List Blobs REST page (service maximum), fewer round-trips for large prefixes
+LIST_BLOBS_PAGE_SIZE = 5000
+
+# HTTP connection pool, sized so parallel block uploads don't hit "Connection pool is full"
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Large uploads: blobs above MAX_SINGLE_PUT_SIZE are split into MAX_BLOCK_SIZE
+# blocks, UPLOAD_MAX_CONCURRENCY of them in flight at once. Capped to each
+# concurrent job's share of the connection pool, which all jobs use together.
+MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024
+MAX_BLOCK_SIZE = 16 * 1024 * 1024
+UPLOAD_MAX_CONCURRENCY = min(
+    max(8, (os.cpu_count() or 1) * 2),
+    HTTP_POOL_MAXSIZE // WORKER_MAX_CONCURRENT_JOBS
+)
+
+# Streaming uploads (BlobBlockWriter): block size and blocks staged at once
+STAGE_BLOCK_SIZE = 8 * 1024 * 1024
+STAGE_MAX_CONCURRENCY = 4
+
+def _create_transport() -> RequestsTransport:
+    """requests-based transport with a connection pool large enough for parallel uploads"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session)
+
+def _throttle_request(request) -> None:
+    """Per-request pipeline hook: wait for the Azure ops rate limit (retries and each block count)"""
+    azure_ops_bucket.acquire()
+
 def _guess_content_type(name: str) -> ContentSettings | None:
     ext = os.path.splitext(name)[1].lower()
     ct = MIME_MAP.get(ext)
     return ContentSettings(content_type=ct) if ct else None
 
+class BlobBlockWriter(io.RawIOBase):
+    """
+    Write-only, non-seekable file object that uploads to a block blob as it goes.
+
+    Written bytes are staged as STAGE_BLOCK_SIZE blocks (a few in flight at
+    once) and the block list is committed on close, so large generated files
+    such as ZIPs never have to exist on disk. zipfile can write to it
+    directly. Leaving a with-block on an exception skips the commit; the
+    staged blocks are discarded by Azure.
+    """
+
+    def __init__(self, blob_client, content_settings: ContentSettings | None = None):
+        self.blob_client = blob_client
+        self.content_settings = content_settings
+        self._buffer = bytearray()
+        self._block_ids = []
+        self._pending = []
+        self._pool = ThreadPoolExecutor(max_workers=STAGE_MAX_CONCURRENCY, thread_name_prefix="BlobBlockWriter")
+        self._aborted = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= STAGE_BLOCK_SIZE:
+            self._stage(bytes(self._buffer[:STAGE_BLOCK_SIZE]))
+            del self._buffer[:STAGE_BLOCK_SIZE]
+        return len(data)
+
+    def _stage(self, chunk: bytes):
+        # Wait for the oldest block first so at most STAGE_MAX_CONCURRENCY chunks are held in memory
+        if len(self._pending) >= STAGE_MAX_CONCURRENCY:
+            self._pending.pop(0).result()
+        block_id = uuid.uuid4().hex
+        self._block_ids.append(block_id)
+        self._pending.append(self._pool.submit(self.blob_client.stage_block, block_id, chunk))
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                if self._buffer:
+                    self._stage(bytes(self._buffer))
+                    self._buffer.clear()
+                for future in self._pending:
+                    future.result()
+                self.blob_client.commit_block_list(
+                    [BlobBlock(block_id=block_id) for block_id in self._block_ids],
+                    content_settings=self.content_settings
+                )
+        finally:
+            self._pool.shutdown(wait=True)
+            super().close()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._aborted = True
+        self.close()
+
+
 class AzureStorageManager:
     def __init__(self, container_name: str):
-        connection_string = os.getenv("AZURE_CONNECTION_STRING")
-        if not connection_string:
+        if not AZURE_CONNECTION_STRING:
             raise ValueError("AZURE_CONNECTION_STRING environment variable is not set")
-        self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+        self.blob_service_client = BlobServiceClient.from_connection_string(
+            AZURE_CONNECTION_STRING,
+            max_single_put_size=MAX_SINGLE_PUT_SIZE,
+            max_block_size=MAX_BLOCK_SIZE,
+            transport=_create_transport(),
+            raw_request_hook=_throttle_request
+        )
         self.container_client = self.blob_service_client.get_container_client(container_name)
         self.container_name = container_name
         self.account_name = self.blob_service_client.account_name
@@ -44,9 +152,10 @@ class AzureStorageManager:
         """
         Upload a file to Azure Blob Storage with chunked upload for large files.
         
-        Uses the blob client's upload_blob method which automatically handles
-        chunking for files larger than 256MB. This prevents memory issues and
-        provides better reliability for large file uploads.
+        Uses the blob client's upload_blob method, which sends files larger
+        than MAX_SINGLE_PUT_SIZE as MAX_BLOCK_SIZE blocks uploaded in
+        parallel. This prevents memory issues and provides better
+        reliability for large file uploads.
         
         Args:
             file_path: Local file path to upload
@@ -56,16 +165,29 @@ class AzureStorageManager:
         blob_client = self.container_client.get_blob_client(blob_name)
         
         with open(file_path, "rb") as data:
-            # Azure SDK automatically chunks files > 256MB
-            # max_concurrency allows parallel chunk uploads
             blob_client.upload_blob(
                 data,
                 overwrite=True,
                 timeout=timeout,
-                max_concurrency=4  # Upload up to 4 chunks in parallel
+                max_concurrency=UPLOAD_MAX_CONCURRENCY
             )
         print(f"Uploaded {file_path} as blob {blob_name}")
 
+    def open_blob_writer(self, blob_name: str, content_type: str | None = None) -> BlobBlockWriter:
+        """
+        Open a blob for streaming writes; the blob is created when the writer closes.
+        
+        Args:
+            blob_name: Destination blob name in container (overwritten if it exists)
+            content_type: Optional MIME type for the blob
+            
+        Returns:
+            BlobBlockWriter to use as a context manager
+        """
+        blob_client = self.container_client.get_blob_client(blob_name)
+        content_settings = ContentSettings(content_type=content_type) if content_type else None
+        return BlobBlockWriter(blob_client, content_settings)
+
     def upload_folder(self, folder_path: str, blob_prefix: str = ""):
         """
         Upload entire folder maintaining structure with correct MIME types.
@@ -166,9 +288,10 @@ class AzureStorageManager:
     def download_file(self, blob_name: str, download_path: str):
         with open(download_path, "wb") as f:
             stream = self.container_client.download_blob(blob_name)
-            f.write(stream.readall())
+            # Write chunks as they arrive instead of buffering the whole blob
+            stream.readinto(f)
         print(f"Downloaded {blob_name} to {download_path}")
-    
+
     def download_file_bytes(self, blob_name: str) -> bytes:
         """
         Download a blob and return its contents as bytes.
@@ -194,7 +317,9 @@ class AzureStorageManager:
             project_id: The project ID whose files should be deleted
         """
         prefix = f"{project_id}/"
-        blob_list = self.container_client.list_blobs(name_starts_with=prefix)
+        blob_list = self.container_client.list_blobs(
+            name_starts_with=prefix, results_per_page=LIST_BLOBS_PAGE_SIZE
+        )
         deleted_count = 0
         for blob in blob_list:
             self.container_client.delete_blob(blob.name)
@@ -209,9 +334,29 @@ class AzureStorageManager:
             job_id: The job ID whose files should be deleted
         """
         prefix = f"jobs/{job_id}/"
-        blob_list = self.container_client.list_blobs(name_starts_with=prefix)
+        blob_list = self.container_client.list_blobs(
+            name_starts_with=prefix, results_per_page=LIST_BLOBS_PAGE_SIZE
+        )
         deleted_count = 0
         for blob in blob_list:
             self.container_client.delete_blob(blob.name)
             deleted_count += 1
-        print(f"Deleted {deleted_count} blobs for job {job_id}")
\ No newline at end of file
+        print(f"Deleted {deleted_count} blobs for job {job_id}")
+
+
+@lru_cache(maxsize=8)
+def get_manager(container_name: str) -> AzureStorageManager:
+    """
+    Return the shared AzureStorageManager for a container.
+
+    Reuses one BlobServiceClient (and its HTTP connection pool) per
+    container instead of reconnecting and re-checking the container each
+    time a caller needs storage access.
+
+    Args:
+        container_name: Blob container name
+
+    Returns:
+        Cached AzureStorageManager instance
+    """
+    return AzureStorageManager(container_name)
@@ -1,32 +1,126 @@
-import os
-from pymongo import MongoClient
-from dotenv import load_dotenv
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from bson import json_util
+from pymongo import MongoClient, IndexModel, UpdateOne, ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError
 from datetime import datetime, timedelta
 from typing import List, Optional
+from config.settings import (
+    MONGO_CONNECTION_STRING,
+    NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    STATISTICS_CACHE_TTL,
+    PROJECT_COUNT_CACHE_TTL
+)
 
 # Legacy models - not used for parcel jobs
 # from models.Project import Project
 # from models.Job import Job
 
-from storage.az import AzureStorageManager
-from io import BytesIO
+from storage.az import get_manager
+
+# Process-wide MongoClient shared by every DatabaseManager (MongoClient is thread-safe and pools connections)
+_client: Optional[MongoClient] = None
+_client_lock = threading.Lock()
+
+
+def get_mongo_client() -> MongoClient:
+    """Return the shared MongoClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if not MONGO_CONNECTION_STRING:
+                    raise ValueError("MONGO_CONNECTION_STRING environment variable is not set")
+                _client = MongoClient(
+                    MONGO_CONNECTION_STRING,
+                    maxPoolSize=MONGO_MAX_POOL_SIZE,
+                    minPoolSize=MONGO_MIN_POOL_SIZE,
+                    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+                    serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                    retryWrites=True
+                )
+    return _client
+
+
+# Small pool for issuing independent queries concurrently, shared like the client
+# (MongoClient is thread-safe)
+_query_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="DatabaseQuery")
+
+
+def close_mongo_client():
+    """Close the shared MongoClient so the next get_mongo_client() call creates a fresh one"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# Capped collection the API appends to whenever it queues a ParcelJob; the worker tails it
+JOB_EVENTS_COLLECTION = 'job_events'
+JOB_EVENTS_SIZE_BYTES = 8 * 1024 * 1024
+
+
+# Fields returned by get_projects_paginated for list views
+PROJECT_LIST_FIELDS = ['_id', 'name', 'client', 'created_at', 'date', 'tags', 'point_count', 'ortho.thumbnail']
+
+
+def _list_projection(fields: List[str]) -> dict:
+    """
+    Inclusion projection for the given fields, leaving out any dotted path
+    whose parent is also included (MongoDB rejects e.g. ortho with ortho.thumbnail)
+    """
+    unique = set(fields)
+    return {
+        field: 1 for field in unique
+        if not any(field.startswith(other + '.') for other in unique)
+    }
+
+
+def _facet_value(facets: dict, name: str, field: str) -> int:
+    """Read a single value out of a $facet branch, defaulting to 0 when the branch is empty"""
+    branch = facets.get(name) or []
+    return branch[0].get(field, 0) if branch else 0
 
-#load_dotenv()
 
 class DatabaseManager:
+    # Bump when the index definitions in _ensure_indexes change
+    _INDEX_SCHEMA_VERSION = 4
+    # Set once indexes have been ensured in this process
+    _indexes_ensured = False
+
     def __init__(self):
-        self.name = os.getenv("NAME") # Name of the database collection and container
-        self.az = AzureStorageManager(self.name) # Initialize Azure Storage Manager
-        conn = os.getenv("MONGO_CONNECTION_STRING")
-        self.client = MongoClient(conn)
+        self.name = NAME # Name of the database collection and container
+        self.az = get_manager(self.name) # Shared Azure Storage Manager for this container
+        self.client = get_mongo_client()
         self.db = self.client[self.name]
         print(f'Connected to MongoDB database: {self.name}\n') 
         self.projectsCollection = self.db['Project'] # Get the Project collection from the database
         self.jobsCollection = self.db['Job'] # Get the Job collection from the database
         self.parcelJobsCollection = self.db['ParcelJob'] # Get the ParcelJob collection from the database
+        self.workerStateCollection = self.db['worker_state'] # Worker bookkeeping (change stream resume token)
+        
+        # Short-lived cache for get_statistics: (monotonic timestamp, statistics)
+        self._stats_cache = (0.0, None)
+        self._stats_lock = threading.Lock()
+        
+        # Paginated project totals keyed by filter: {filter_key: (monotonic timestamp, total)}
+        self._count_cache = {}
+        self._count_lock = threading.Lock()
+        
+        # Open pooled connections now so the first request doesn't pay for the handshake
+        self._warm_up()
         
         # Ensure indexes exist for efficient queries
         self._ensure_indexes()
+        
+        # Capped job_events collection, or None when the server can't provide one
+        self.jobEventsCollection = self._ensure_job_events()
 
     def query(self, query):
         #collection = self.db[collection_name]
@@ -39,77 +133,127 @@ class DatabaseManager:
         #return result.inserted_id
 
     def close(self):
-        self.client.close()
+        # The MongoClient is shared process-wide (see get_mongo_client), so it
+        # is only closed at process shutdown with close_mongo_client()
+        pass
     
+    def _warm_up(self):
+        """
+        Prime server selection, TLS/auth handshake and the connection pool
+        with a ping and a cheap read on the job collections.
+        """
+        try:
+            self.client.admin.command('ping')
+            self.jobsCollection.find_one({}, {'_id': 1})
+            self.parcelJobsCollection.find_one({}, {'_id': 1})
+        except Exception as e:
+            # Don't fail initialization, the first real query will retry the connection
+            print(f"Warning: MongoDB warm-up failed: {e}")
+
+    def _ensure_job_events(self):
+        """
+        Return the capped job_events collection, creating it if needed.
+        
+        Tailing a capped collection only costs the inserts made to it, unlike
+        a change stream which the server filters out of every write. Azure
+        Cosmos DB has no capped collections, so None is returned there and
+        the worker uses a change stream instead.
+        """
+        try:
+            if not self.db.list_collection_names(filter={'name': JOB_EVENTS_COLLECTION}):
+                self.db.create_collection(JOB_EVENTS_COLLECTION, capped=True, size=JOB_EVENTS_SIZE_BYTES)
+            collection = self.db[JOB_EVENTS_COLLECTION]
+            if not collection.options().get('capped'):
+                print(f"Note: {JOB_EVENTS_COLLECTION} exists but is not capped, not using it for job notifications")
+                return None
+            return collection
+        except PyMongoError as e:
+            print(f"Note: Capped collections not supported ({e}), job notifications use change streams")
+            return None
+
+    def notify_job_queued(self, job_id: str):
+        """
+        Append a job_events entry so a tailing worker picks the job up immediately.
+        
+        Best effort: the worker also drains pending jobs whenever it (re)opens
+        its cursor, so a lost event only delays the job.
+        """
+        if self.jobEventsCollection is None:
+            return
+        try:
+            self.jobEventsCollection.insert_one({'job_id': job_id, 'ts': datetime.utcnow()})
+        except PyMongoError as e:
+            print(f"Warning: Failed to record job event for {job_id}: {e}")
+
     def _ensure_indexes(self):
         """
         Ensure required indexes exist on collections.
         This is especially important for Azure Cosmos DB which requires
         explicit indexes for sort operations.
+        
+        Skipped when this process already ensured them, or when the _meta
+        marker shows the current index schema version was already applied.
+        
+        Cosmos DB indexing: the Mongo API (server 3.6+) only indexes _id
+        automatically, so the indexes below are the whole indexing policy and
+        every extra one adds RU cost to each write. Only add indexes for fields
+        that are actually filtered or sorted on, and don't create wildcard
+        ($**) indexes. Accounts created on server 3.2 index every path by
+        default; migrate those to 3.6+ rather than trying to exclude paths,
+        since includedPaths/excludedPaths policies only exist in the NoSQL API.
         """
+        if DatabaseManager._indexes_ensured:
+            return
+        
         try:
-            # Jobs collection indexes
-            # Create index on jobs collection for created_at (used for FIFO sorting)
-            self.jobsCollection.create_index([("created_at", 1)], background=True)
-            print("Ensured index on jobs.created_at")
+            meta = self.db['_meta']
+            if meta.find_one({'_id': 'index_schema', 'v': self._INDEX_SCHEMA_VERSION}):
+                DatabaseManager._indexes_ensured = True
+                return
             
-            # Create index on jobs collection for status (used for filtering pending jobs)
-            self.jobsCollection.create_index([("status", 1)], background=True)
-            print("Ensured index on jobs.status")
+            ensured = []
             
-            # Create compound index for efficient job queries (status + created_at)
-            self.jobsCollection.create_index([("status", 1), ("created_at", 1)], background=True)
-            print("Ensured compound index on jobs.status+created_at")
-            
-            # Create index on jobs collection for project_id (used for getting jobs by project)
-            self.jobsCollection.create_index([("project_id", 1)], background=True)
-            print("Ensured index on jobs.project_id")
-            
-            # Create index on cancelled field for efficient cancellation checks
-            self.jobsCollection.create_index([("cancelled", 1)], background=True)
-            print("Ensured index on jobs.cancelled")
+            # Jobs collection indexes (one createIndexes command per collection)
+            ensured += self.jobsCollection.create_indexes([
+                IndexModel([("created_at", ASCENDING)], background=True),  # FIFO sorting
+                IndexModel([("status", ASCENDING)], background=True),  # Filtering pending jobs
+                IndexModel([("status", ASCENDING), ("created_at", ASCENDING)], background=True),
+                IndexModel([("project_id", ASCENDING)], background=True),  # Jobs by project
+                IndexModel([("cancelled", ASCENDING)], background=True),  # Cancellation checks
+            ])
             
             # ParcelJob collection indexes
-            # Create index on created_at for sorting
-            self.parcelJobsCollection.create_index([("created_at", -1)], background=True)
-            print("Ensured index on parcel_jobs.created_at")
-            
-            # Create index on status for filtering
-            self.parcelJobsCollection.create_index([("status", 1)], background=True)
-            print("Ensured index on parcel_jobs.status")
+            ensured += self.parcelJobsCollection.create_indexes([
+                IndexModel([("created_at", DESCENDING)], background=True),  # Sorting
+                IndexModel([("status", ASCENDING)], background=True),  # Filtering
+                IndexModel([("user_id", ASCENDING)], background=True),  # Filtering by user
+                IndexModel([("status", ASCENDING), ("created_at", DESCENDING)], background=True),
+                IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)], background=True),
+            ])
             
-            # Create index on user_id for filtering by user
-            self.parcelJobsCollection.create_index([("user_id", 1)], background=True)
-            print("Ensured index on parcel_jobs.user_id")
-            
-            # Create compound index for efficient queries
-            self.parcelJobsCollection.create_index([("status", 1), ("created_at", -1)], background=True)
-            print("Ensured compound index on parcel_jobs.status+created_at")
-            
-            # Create compound index for user-specific queries
-            self.parcelJobsCollection.create_index([("user_id", 1), ("created_at", -1)], background=True)
-            print("Ensured compound index on parcel_jobs.user_id+created_at")
+            # Worker FIFO claim: only pending jobs, in created_at order, so the
+            # index stays small however many finished jobs accumulate
+            # Note: Azure Cosmos DB for MongoDB may not support partial indexes
+            try:
+                self.parcelJobsCollection.create_index(
+                    [("status", ASCENDING), ("created_at", ASCENDING)],
+                    partialFilterExpression={"status": "pending"},
+                    background=True,
+                    name="pending_fifo"
+                )
+                ensured.append("pending_fifo")
+            except Exception as partial_index_error:
+                # The (status, created_at) index above still serves the claim
+                print(f"Note: Partial index not supported ({partial_index_error}), claims use the status/created_at index")
             
             # Projects collection indexes
-            # Create index on created_at field (descending) for sorting newest first
-            self.projectsCollection.create_index([("created_at", -1)], background=True)
-            print("Ensured index on projects.created_at")
-            
-            # Create index on name field for sorting and filtering
-            self.projectsCollection.create_index([("name", 1)], background=True)
-            print("Ensured index on projects.name")
-            
-            # Create index on client field for filtering
-            self.projectsCollection.create_index([("client", 1)], background=True)
-            print("Ensured index on projects.client")
-            
-            # Create index on tags field (array index) for efficient tag filtering
-            self.projectsCollection.create_index([("tags", 1)], background=True)
-            print("Ensured index on projects.tags")
-            
-            # Create compound index on client and created_at for efficient filtered sorting
-            self.projectsCollection.create_index([("client", 1), ("created_at", -1)], background=True)
-            print("Ensured compound index on projects.client+created_at")
+            ensured += self.projectsCollection.create_indexes([
+                IndexModel([("created_at", DESCENDING)], background=True),  # Newest first
+                IndexModel([("name", ASCENDING)], background=True),  # Sorting and filtering
+                IndexModel([("client", ASCENDING)], background=True),  # Filtering
+                IndexModel([("tags", ASCENDING)], background=True),  # Array index for tag filtering
+                IndexModel([("client", ASCENDING), ("created_at", DESCENDING)], background=True),
+            ])
             
             # Try to create text index on name and description fields for search functionality
             # Note: Azure Cosmos DB for MongoDB may not support text indexes
@@ -119,12 +263,21 @@ class DatabaseManager:
                     background=True,
                     name="text_search_index"
                 )
-                print("Ensured text index on projects.name+description")
+                ensured.append("text_search_index")
             except Exception as text_index_error:
                 # Text indexes not supported (e.g., in Azure Cosmos DB)
                 # Search will use regex instead, which still benefits from the name index
                 print(f"Note: Text index not supported ({text_index_error}), will use regex-based search")
             
+            # Record the applied schema version so later processes skip index creation
+            meta.update_one(
+                {'_id': 'index_schema'},
+                {'$set': {'v': self._INDEX_SCHEMA_VERSION, 'updated_at': datetime.utcnow()}},
+                upsert=True
+            )
+            DatabaseManager._indexes_ensured = True
+            print(f"Ensured indexes: {', '.join(ensured)}")
+            
         except Exception as e:
             print(f"Warning: Failed to create indexes: {e}")
             # Don't fail initialization if index creation fails
@@ -213,21 +366,34 @@ class DatabaseManager:
     # See git history for full implementation of legacy methods
 
     def get_projects_paginated(self, query_filter: dict = None, sort_by: str = "created_at", 
-                               sort_order: str = "desc", limit: int = 50, offset: int = 0) -> dict:
+                               sort_order: str = "desc", limit: int = 50, offset: int = 0,
+                               after_created_at: Optional[datetime] = None,
+                               after_id: Optional[str] = None,
+                               fields: Optional[List[str]] = None) -> dict:
         """
         Get paginated projects with filtering and sorting
         
+        When sorting by created_at, pass the previous page's next_cursor values
+        as after_created_at/after_id to page by key on (created_at, _id) instead
+        of skipping, so deep pages cost the same as the first one.
+        
         Args:
             query_filter: MongoDB query filter (default: None, returns all projects)
             sort_by: Field to sort by (created_at, date, name, client)
             sort_order: Sort order (asc or desc)
             limit: Maximum number of projects to return
-            offset: Number of projects to skip
+            offset: Number of projects to skip (ignored when a cursor is given)
+            after_created_at: created_at of the last project on the previous page
+            after_id: _id of the last project on the previous page
+            fields: Extra fields to return on top of PROJECT_LIST_FIELDS
             
         Returns:
             dict: {
                 'projects': List of project dictionaries,
-                'total': Total count of projects matching the filter
+                'total': Total count of projects matching the filter,
+                'next_cursor': {'after_created_at', 'after_id'} for the next page,
+                               or None when there are no more pages or sort_by
+                               is not created_at
             }
         """
         # Default to empty filter if none provided
@@ -237,111 +403,153 @@ class DatabaseManager:
         # Convert sort_order to MongoDB format
         sort_direction = -1 if sort_order == "desc" else 1
         
-        # Build aggregation pipeline
-        pipeline = []
-        
-        # Stage 1: Match filter
-        if query_filter:
-            pipeline.append({'$match': query_filter})
-        
-        # Stage 2: Add fields to handle null values in sorting
-        # Null values should be placed at the end regardless of sort order
-        # We create a sort_field that replaces null with a value that sorts last
-        if sort_by in ['date', 'name', 'client']:
-            # For text fields, use empty string for nulls (sorts last in ascending, first in descending)
-            # For date fields, use a far future/past date
-            if sort_by == 'date':
-                # Use a far future date for nulls when descending, far past when ascending
-                null_replacement = datetime(9999, 12, 31) if sort_order == "desc" else datetime(1970, 1, 1)
-            else:
-                # For text fields, use a value that sorts last
-                null_replacement = "zzzzzzzzz" if sort_order == "asc" else ""
-            
-            pipeline.append({
-                '$addFields': {
-                    f'{sort_by}_sort': {
-                        '$ifNull': [f'${sort_by}', null_replacement]
-                    }
-                }
-            })
-            sort_field = f'{sort_by}_sort'
+        # Sort directly on the stored field so the existing indexes
+        # (created_at, name, client, client+created_at) can back the sort.
+        # MongoDB already sorts nulls/missing values last when descending;
+        # ascending sorts on nullable fields fetch them separately (below).
+        # Secondary sort by created_at desc keeps ties stable across pages.
+        # When sorting by created_at, _id breaks ties so keyset cursors are exact.
+        sort_spec = [(sort_by, sort_direction)]
+        if sort_by != 'created_at':
+            sort_spec.append(('created_at', -1))
         else:
-            # For created_at, nulls are unlikely but handle them anyway
-            sort_field = sort_by
-        
-        # Stage 3: Sort with primary and secondary sort
-        # Primary sort by the requested field, secondary sort by created_at desc for consistency
-        sort_stage = {
-            '$sort': {
-                sort_field: sort_direction
-            }
-        }
+            sort_spec.append(('_id', 1))
         
-        # Add secondary sort by created_at if not already sorting by it
-        if sort_by != 'created_at':
-            sort_stage['$sort']['created_at'] = -1
-        
-        pipeline.append(sort_stage)
-        
-        # Stage 4: Facet to get both paginated results and total count
-        pipeline.append({
-            '$facet': {
-                'projects': [
-                    {'$skip': offset},
-                    {'$limit': limit}
-                ],
-                'total_count': [
-                    {'$count': 'count'}
-                ]
-            }
-        })
+        # Keyset pagination: continue after the cursor instead of skipping offset docs
+        page_filter = query_filter
+        skip = offset
+        use_keyset = sort_by == 'created_at' and after_created_at is not None and after_id is not None
+        if use_keyset:
+            past_cursor = '$lt' if sort_direction == -1 else '$gt'
+            keyset = {'$or': [
+                {'created_at': {past_cursor: after_created_at}},
+                {'created_at': after_created_at, '_id': {'$gt': after_id}}
+            ]}
+            page_filter = {'$and': [query_filter, keyset]} if query_filter else keyset
+            skip = 0
         
-        # Execute aggregation with collation for case-insensitive text sorting
+        # Collation for case-insensitive text sorting
         collation = {
             'locale': 'en',
             'strength': 2  # Case-insensitive comparison
         }
         
+        # Only return the fields list views need
+        projection = _list_projection(PROJECT_LIST_FIELDS + (fields or []))
+        
+        def find(query, skip, limit, collation):
+            return list(self.projectsCollection.find(
+                query, projection, sort=sort_spec, skip=skip, limit=limit, collation=collation
+            ))
+        
+        # Ascending sorts would put nulls first; keep them last instead by
+        # paging through non-null values, then continuing into the null ones
+        nulls_last = sort_by != 'created_at' and sort_direction == 1
+        
+        def fetch_page(collation):
+            if not nulls_last:
+                return find(page_filter, skip, limit, collation)
+            
+            has_value = {sort_by: {'$ne': None}}
+            is_null = {sort_by: None}
+            page = find(
+                {'$and': [page_filter, has_value]} if page_filter else has_value,
+                skip, limit, collation
+            )
+            if len(page) == limit:
+                return page
+            
+            # Non-null values ran out on this page; work out how far into the nulls to start
+            if page:
+                null_skip = 0
+            else:
+                non_null_total = self.projectsCollection.count_documents(
+                    {'$and': [page_filter, has_value]} if page_filter else has_value
+                )
+                null_skip = max(0, skip - non_null_total)
+            
+            return page + find(
+                {'$and': [page_filter, is_null]} if page_filter else is_null,
+                null_skip, limit - len(page), collation
+            )
+        
+        # The page and the total are independent queries, so run them concurrently
+        # instead of in one $facet (whose count branch can't use indexes on Cosmos DB)
+        projects_future = _query_pool.submit(fetch_page, collation)
+        total = self._count_projects(query_filter)
+        
         try:
-            results = list(self.projectsCollection.aggregate(pipeline, collation=collation))
+            projects = projects_future.result()
         except Exception as e:
             # If collation fails (e.g., not supported), try without it
             print(f"Warning: Collation not supported, using default sorting: {e}")
-            results = list(self.projectsCollection.aggregate(pipeline))
+            projects = fetch_page(None)
         
-        # Extract results
-        if results:
-            projects = results[0].get('projects', [])
-            total_count_list = results[0].get('total_count', [])
-            total = total_count_list[0]['count'] if total_count_list else 0
-        else:
-            projects = []
-            total = 0
+        next_cursor = None
+        if sort_by == 'created_at' and projects and len(projects) == limit:
+            last = projects[-1]
+            next_cursor = {
+                'after_created_at': last.get('created_at'),
+                'after_id': last.get('_id')
+            }
         
-        print(f"Retrieved {len(projects)} projects (offset: {offset}, limit: {limit}, total: {total})")
+        mode = "keyset" if use_keyset else f"offset: {offset}"
+        print(f"Retrieved {len(projects)} projects ({mode}, limit: {limit}, total: {total})")
         
         return {
             'projects': projects,
-            'total': total
+            'total': total,
+            'next_cursor': next_cursor
         }
 
 
+    def _count_projects(self, query_filter: dict) -> int:
+        """
+        Count projects matching a filter, reusing a cached total for
+        PROJECT_COUNT_CACHE_TTL seconds per distinct filter
+        """
+        key = json_util.dumps(query_filter, sort_keys=True)
+        now = time.monotonic()
+        
+        cached = self._count_cache.get(key)
+        if cached and now - cached[0] < PROJECT_COUNT_CACHE_TTL:
+            return cached[1]
+        
+        total = self.projectsCollection.count_documents(query_filter)
+        with self._count_lock:
+            # Drop expired entries so distinct filters don't accumulate forever
+            self._count_cache = {
+                k: v for k, v in self._count_cache.items()
+                if now - v[0] < PROJECT_COUNT_CACHE_TTL
+            }
+            self._count_cache[key] = (now, total)
+        return total
+
     def get_statistics(self) -> dict:
         """
         Get aggregated statistics for the dashboard
         
         Returns:
             dict: {
-                'total_projects': Total number of projects,
+                'total_projects': Total number of projects (estimated from collection
+                                  metadata, may briefly lag recent inserts/deletes),
                 'total_points': Sum of all point counts,
                 'active_jobs': Count of pending/processing jobs,
                 'completed_jobs_24h': Count of jobs completed in last 24 hours,
                 'failed_jobs_24h': Count of jobs failed in last 24 hours
             }
+        
+        Results are cached for STATISTICS_CACHE_TTL seconds so dashboard
+        polling doesn't rerun the aggregations on every request.
         """
+        now = time.monotonic()
+        ts, cached = self._stats_cache
+        if cached is not None and now - ts < STATISTICS_CACHE_TTL:
+            return cached
+        
         try:
-            # Count total projects
-            total_projects = self.projectsCollection.count_documents({})
+            # Count total projects from collection metadata (no scan)
+            total_projects = self.projectsCollection.estimated_document_count()
             
             # Calculate total points using aggregation pipeline
             # Handle null point_count values by treating them as 0
@@ -361,23 +569,35 @@ class DatabaseManager:
             points_result = list(self.projectsCollection.aggregate(points_pipeline))
             total_points = points_result[0]['total'] if points_result else 0
             
-            # Count active jobs (status in pending, processing)
-            active_jobs = self.jobsCollection.count_documents({
-                'status': {'$in': ['pending', 'processing']}
-            })
-            
-            # Count completed jobs in last 24 hours
+            # Jobs: active, completed and failed counts in one round-trip
             cutoff_time = datetime.utcnow() - timedelta(hours=24)
-            completed_jobs_24h = self.jobsCollection.count_documents({
-                'status': 'completed',
-                'completed_at': {'$gte': cutoff_time}
-            })
+            jobs_pipeline = [
+                {
+                    '$facet': {
+                        # Status in pending, processing
+                        'active': [
+                            {'$match': {'status': {'$in': ['pending', 'processing']}}},
+                            {'$count': 'n'}
+                        ],
+                        # Completed in last 24 hours
+                        'completed_24h': [
+                            {'$match': {'status': 'completed', 'completed_at': {'$gte': cutoff_time}}},
+                            {'$count': 'n'}
+                        ],
+                        # Failed in last 24 hours
+                        'failed_24h': [
+                            {'$match': {'status': 'failed', 'completed_at': {'$gte': cutoff_time}}},
+                            {'$count': 'n'}
+                        ]
+                    }
+                }
+            ]
             
-            # Count failed jobs in last 24 hours
-            failed_jobs_24h = self.jobsCollection.count_documents({
-                'status': 'failed',
-                'completed_at': {'$gte': cutoff_time}
-            })
+            jobs_result = list(self.jobsCollection.aggregate(jobs_pipeline))
+            jobs_facets = jobs_result[0] if jobs_result else {}
+            active_jobs = _facet_value(jobs_facets, 'active', 'n')
+            completed_jobs_24h = _facet_value(jobs_facets, 'completed_24h', 'n')
+            failed_jobs_24h = _facet_value(jobs_facets, 'failed_24h', 'n')
             
             statistics = {
                 'total_projects': total_projects,
@@ -387,6 +607,9 @@ class DatabaseManager:
                 'failed_jobs_24h': failed_jobs_24h
             }
             
+            with self._stats_lock:
+                self._stats_cache = (now, statistics)
+            
             print(f"Retrieved statistics: {statistics}")
             return statistics
             
@@ -410,31 +633,63 @@ class DatabaseManager:
         Returns:
             bool: True if project was updated successfully, False if project not found
         """
-        # Build the ortho object
-        ortho_data = {
+        result = self.bulk_update_project_orthos([{
+            'project_id': project_id,
             'url': url,
-            'thumbnail': thumbnail_url,
+            'thumbnail_url': thumbnail_url,
             'bounds': bounds
-        }
-        
-        # Update the project document
-        result = self.projectsCollection.update_one(
-            {'_id': project_id},
-            {
-                '$set': {
-                    'ortho': ortho_data,
-                    'updated_at': datetime.utcnow()
-                }
-            }
-        )
+        }])
         
-        if result.matched_count == 0:
+        if result['matched_count'] == 0:
             print(f"Project {project_id} not found, cannot update ortho")
             return False
         
-        if result.modified_count > 0:
+        if result['modified_count'] > 0:
             print(f"Updated ortho for project {project_id}")
             return True
         else:
             print(f"Project {project_id} ortho already up to date")
-            return True
\ No newline at end of file
+            return True
+
+    def bulk_update_project_orthos(self, entries: List[dict]) -> dict:
+        """
+        Update ortho URLs and bounds for many projects in one bulk_write round-trip
+        
+        Args:
+            entries: List of dicts with project_id, url and optional
+                     thumbnail_url and bounds (same meaning as update_project_ortho)
+            
+        Returns:
+            dict: {
+                'matched_count': Number of projects found,
+                'modified_count': Number of projects whose ortho changed
+            }
+        """
+        if not entries:
+            return {'matched_count': 0, 'modified_count': 0}
+        
+        now = datetime.utcnow()
+        ops = [
+            UpdateOne(
+                {'_id': entry['project_id']},
+                {
+                    '$set': {
+                        'ortho': {
+                            'url': entry['url'],
+                            'thumbnail': entry.get('thumbnail_url'),
+                            'bounds': entry.get('bounds')
+                        },
+                        'updated_at': now
+                    }
+                }
+            )
+            for entry in entries
+        ]
+        
+        # Unordered so one missing project doesn't stop the rest
+        result = self.projectsCollection.bulk_write(ops, ordered=False)
+        
+        return {
+            'matched_count': result.matched_count,
+            'modified_count': result.modified_count
+        }
@@ -1,9 +1,26 @@
 """
 Survey all Beacon counties to identify interface versions and variations
 """
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+import asyncio
 import json
-import time
+import logging
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+logger = logging.getLogger(__name__)
+
+# Max counties surveyed at once (one browser context each)
+MAX_CONCURRENT_COUNTIES = 10
+
+# Returns id/type/placeholder for every visible <input> on the page.
+# Uses getAttribute so missing attributes come back empty, matching get_attribute().
+VISIBLE_INPUTS_JS = """() => Array.from(document.querySelectorAll('input'))
+    .filter(i => i.offsetParent !== null)
+    .map(i => ({
+        id: i.getAttribute('id') || '',
+        type: i.getAttribute('type') || '',
+        placeholder: i.getAttribute('placeholder') || ''
+    }))"""
 
 # Load Indiana counties
 with open('apps/web/src/data/gis/Indiana.json', 'r') as f:
@@ -11,77 +28,80 @@ with open('apps/web/src/data/gis/Indiana.json', 'r') as f:
 
 # Filter Beacon counties
 beacon_counties = [
-    c for c in counties 
+    c for c in counties
     if 'beacon.schneidercorp.com' in c.get('url', '')
 ]
 
 print(f"Found {len(beacon_counties)} Beacon counties")
 print("=" * 80)
 
-results = []
-
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    context = browser.new_context()
-    page = context.new_page()
-    page.set_default_timeout(15000)
-    
-    for idx, county_data in enumerate(beacon_counties, 1):
-        county = county_data['county']
-        url = county_data['url']
-        
-        print(f"\n[{idx}/{len(beacon_counties)}] {county} County")
-        print(f"URL: {url}")
-        
-        result = {
-            'county': county,
-            'url': url,
-            'status': 'unknown',
-            'search_inputs': [],
-            'page_title': '',
-            'has_agree_button': False,
-            'interface_type': 'unknown'
-        }
-        
+
+async def wait_until_ready(page, timeout=5000):
+    """
+    Wait for a visible input instead of a fixed sleep.
+    Beacon keeps background requests running, so networkidle is unreliable.
+    """
+    try:
+        await page.wait_for_selector('input:visible', timeout=timeout)
+    except:
+        pass
+
+
+async def survey_one(browser, semaphore, idx, county_data):
+    """Survey a single county in its own browser context"""
+    county = county_data['county']
+    url = county_data['url']
+
+    result = {
+        'county': county,
+        'url': url,
+        'status': 'unknown',
+        'search_inputs': [],
+        'page_title': '',
+        'has_agree_button': False,
+        'interface_type': 'unknown'
+    }
+
+    async with semaphore:
+        logger.info("[%d/%d] %s County: %s", idx, len(beacon_counties), county, url)
+
+        context = await browser.new_context()
+        page = await context.new_page()
+        page.set_default_timeout(15000)
+
         try:
             # Navigate
-            page.goto(url, wait_until="domcontentloaded", timeout=20000)
-            time.sleep(3)
-            
+            await page.goto(url, wait_until="domcontentloaded", timeout=20000)
+            await wait_until_ready(page)
+
             # Check for Agree button
             try:
                 agree_btn = page.locator('text=Agree').first
-                if agree_btn.is_visible(timeout=2000):
+                if await agree_btn.is_visible(timeout=2000):
                     result['has_agree_button'] = True
-                    agree_btn.click()
-                    time.sleep(3)
+                    await agree_btn.click()
+                    await page.wait_for_load_state('domcontentloaded')
+                    await wait_until_ready(page)
             except:
                 pass
-            
+
             # Get page title
-            result['page_title'] = page.title()
-            
-            # Wait for page to settle
-            time.sleep(5)
-            
-            # Find all visible input elements
-            inputs = page.locator('input').all()
+            result['page_title'] = await page.title()
+
+            # Collect all visible input elements in one round-trip to the browser
+            inputs = await page.evaluate(VISIBLE_INPUTS_JS)
             for inp in inputs:
-                try:
-                    if inp.is_visible():
-                        inp_id = inp.get_attribute('id') or ''
-                        inp_type = inp.get_attribute('type') or ''
-                        inp_placeholder = inp.get_attribute('placeholder') or ''
-                        
-                        if inp_type in ['text', 'search'] or 'search' in inp_placeholder.lower() or 'parcel' in inp_id.lower():
-                            result['search_inputs'].append({
-                                'id': inp_id,
-                                'type': inp_type,
-                                'placeholder': inp_placeholder
-                            })
-                except:
-                    pass
-            
+                inp_id = inp['id']
+                inp_type = inp['type']
+                inp_placeholder = inp['placeholder']
+
+                if inp_type in ['text', 'search'] or 'search' in inp_placeholder.lower() or 'parcel' in inp_id.lower():
+                    result['search_inputs'].append({
+                        'id': inp_id,
+                        'type': inp_type,
+                        'placeholder': inp_placeholder
+                    })
+
             # Determine interface type based on search input
             if any('topSearchControl' in inp['id'] for inp in result['search_inputs']):
                 result['interface_type'] = 'new_beacon'
@@ -91,25 +111,47 @@ with sync_playwright() as p:
                 result['interface_type'] = 'unknown_beacon'
             else:
                 result['interface_type'] = 'no_search_input'
-            
+
             result['status'] = 'success'
-            print(f"  ✓ Interface: {result['interface_type']}")
-            print(f"  ✓ Search inputs: {len(result['search_inputs'])}")
-            if result['search_inputs']:
-                for inp in result['search_inputs']:
-                    print(f"    - id={inp['id']}, type={inp['type']}, placeholder={inp['placeholder']}")
-            
+            logger.info(
+                "  ✓ %s: Interface: %s, search inputs: %s",
+                county,
+                result['interface_type'],
+                ", ".join(f"id={inp['id']} type={inp['type']} placeholder={inp['placeholder']}"
+                          for inp in result['search_inputs']) or "none"
+            )
+
         except Exception as e:
             result['status'] = 'error'
             result['error'] = str(e)
-            print(f"  ✗ Error: {e}")
-        
-        results.append(result)
-        
-        # Small delay between counties
-        time.sleep(2)
-    
-    browser.close()
+            logger.info("  ✗ %s: Error: %s", county, e)
+
+        finally:
+            await context.close()
+
+        # Small delay before this slot picks up the next county
+        await asyncio.sleep(2)
+
+    return result
+
+
+async def survey_all():
+    """Survey every Beacon county with a bounded number of concurrent contexts"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COUNTIES)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            # gather keeps results in county order
+            return await asyncio.gather(*(
+                survey_one(browser, semaphore, idx, county_data)
+                for idx, county_data in enumerate(beacon_counties, 1)
+            ))
+        finally:
+            await browser.close()
+
+
+results = asyncio.run(survey_all())
 
 # Save results
 with open('beacon_survey_results.json', 'w') as f:
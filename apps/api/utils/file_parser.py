@@ -1,10 +1,27 @@
 """
 Utility module for parsing parcel ID files in various formats (TXT, CSV, XLSX)
 """
+import asyncio
 import csv
+import functools
 import io
-from typing import List
+import itertools
+import operator
+from typing import Iterator, List, Sequence
 from fastapi import UploadFile, HTTPException
+from python_calamine import CalamineWorkbook
+from config.settings import MAX_PARCEL_FILE_SIZE_BYTES
+
+
+# Header words that never count as parcel IDs
+_COMMON_HEADERS = frozenset({'parcel', 'id', 'number', 'pin', 'property'})
+
+# Translation table that deletes ASCII digits
+_NO_DIGITS = str.maketrans('', '', '0123456789')
+
+SUPPORTED_EXTENSIONS = frozenset({'txt', 'csv', 'xlsx'})
+READ_CHUNK_SIZE = 64 * 1024
+THREADED_CSV_MIN_BYTES = 1024 * 1024  # CSVs above this are parsed off the event loop
 
 
 async def parse_parcel_file(file: UploadFile) -> List[str]:
@@ -27,20 +44,35 @@ async def parse_parcel_file(file: UploadFile) -> List[str]:
     """
     file_ext = file.filename.split('.')[-1].lower()
     
+    # Reject before buffering anything
+    if file_ext not in SUPPORTED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file format: {file_ext}"
+        )
+    
+    content_type = (file.content_type or '').lower()
+    if content_type.startswith(('image/', 'audio/', 'video/')):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported content type: {content_type}"
+        )
+    
+    content = await read_upload_limited(file, MAX_PARCEL_FILE_SIZE_BYTES)
+    
     try:
-        content = await file.read()
-        
+        # XLSX and large CSV parsing is CPU-bound; run it in a thread so the
+        # event loop keeps serving other requests meanwhile
         if file_ext == 'txt':
             return parse_txt(content)
         elif file_ext == 'csv':
+            if len(content) > THREADED_CSV_MIN_BYTES:
+                return await asyncio.to_thread(parse_csv, content)
             return parse_csv(content)
-        elif file_ext == 'xlsx':
-            return parse_xlsx(content)
         else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file format: {file_ext}"
-            )
+            return await asyncio.to_thread(parse_xlsx, content)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -48,6 +80,31 @@ async def parse_parcel_file(file: UploadFile) -> List[str]:
         )
 
 
+async def read_upload_limited(file: UploadFile, max_bytes: int) -> bytes:
+    """
+    Read an upload in chunks, stopping as soon as it exceeds max_bytes
+    
+    Args:
+        file: Uploaded file object
+        max_bytes: Largest accepted size
+        
+    Returns:
+        File content as bytes
+        
+    Raises:
+        HTTPException: 413 if the file is larger than max_bytes
+    """
+    buf = bytearray()
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Parcel file too large. Max size: {max_bytes / (1024**2):.0f} MB"
+            )
+    return bytes(buf)
+
+
 def parse_txt(content: bytes) -> List[str]:
     """
     Parse TXT file - one parcel ID per line
@@ -58,13 +115,11 @@ def parse_txt(content: bytes) -> List[str]:
     Returns:
         List of parcel IDs
     """
-    text = content.decode('utf-8')
-    lines = text.strip().split('\n')
-    
-    # Filter out empty lines and strip whitespace
-    parcel_ids = [line.strip() for line in lines if line.strip()]
+    # splitlines handles \r\n and avoids the full-size copy from text.strip()
+    lines = content.decode('utf-8').splitlines()
     
-    return parcel_ids
+    # Strip whitespace once per line and drop empty lines
+    return [parcel_id for parcel_id in (line.strip() for line in lines) if parcel_id]
 
 
 def parse_csv(content: bytes) -> List[str]:
@@ -78,85 +133,79 @@ def parse_csv(content: bytes) -> List[str]:
         List of parcel IDs
     """
     text = content.decode('utf-8')
-    csv_file = io.StringIO(text)
-    reader = csv.DictReader(csv_file)
+    # skipinitialspace drops leading blanks in C, so only trailing ones need strip()
+    reader = csv.reader(io.StringIO(text), skipinitialspace=True)
     
-    parcel_ids = []
+    # Inspect the first row once to pick the column and decide whether it's a header
+    header = next(reader, None)
     
-    # Check if there's a "Parcel ID" column
-    if reader.fieldnames and 'Parcel ID' in reader.fieldnames:
-        for row in reader:
-            parcel_id = row.get('Parcel ID', '').strip()
-            if parcel_id:
-                parcel_ids.append(parcel_id)
-    else:
-        # Fall back to first column
-        csv_file.seek(0)
-        reader = csv.reader(csv_file)
-        
-        # Skip header if it exists
-        first_row = next(reader, None)
-        if first_row and not is_parcel_id(first_row[0]):
-            # First row is likely a header, skip it
-            pass
-        else:
-            # First row is data, include it
-            if first_row and first_row[0].strip():
-                parcel_ids.append(first_row[0].strip())
-        
-        # Read remaining rows
-        for row in reader:
-            if row and row[0].strip():
-                parcel_ids.append(row[0].strip())
+    col = 0  # Fall back to first column
+    rows = reader  # Header skipped unless it turns out to be data
     
-    return parcel_ids
+    if header and 'Parcel ID' in header:
+        col = header.index('Parcel ID')
+    elif header and is_parcel_id(header[0]):
+        # First row is data, include it
+        rows = itertools.chain([header], reader)
+    
+    getter = operator.itemgetter(col)
+    return [parcel_id for parcel_id in (getter(row).strip() for row in rows if len(row) > col) if parcel_id]
 
 
 def parse_xlsx(content: bytes) -> List[str]:
     """
     Parse XLSX file - first column or column named "Parcel ID"
     
+    Uses python-calamine (Rust), which reads much faster than openpyxl.
+    
     Args:
         content: File content as bytes
         
     Returns:
         List of parcel IDs
     """
-    try:
-        import openpyxl
-    except ImportError:
-        raise HTTPException(
-            status_code=500,
-            detail="openpyxl library not installed. Cannot parse XLSX files."
-        )
+    workbook = CalamineWorkbook.from_filelike(io.BytesIO(content))
+    rows = workbook.get_sheet_by_index(0).to_python()
     
-    # Load workbook from bytes
-    workbook = openpyxl.load_workbook(io.BytesIO(content))
-    sheet = workbook.active
+    return _extract_parcel_column(iter(rows))
+
+
+def _extract_parcel_column(rows: Iterator[Sequence]) -> List[str]:
+    """
+    Pull parcel IDs out of spreadsheet rows
     
+    Args:
+        rows: Iterator of row value sequences, header row first
+        
+    Returns:
+        List of parcel IDs
+    """
     parcel_ids = []
     
     # Check if first row contains "Parcel ID" header
-    first_row = [cell.value for cell in sheet[1]]
-    parcel_col_idx = None
+    first_row = list(next(rows, None) or ())
     
     if 'Parcel ID' in first_row:
-        parcel_col_idx = first_row.index('Parcel ID')
-        start_row = 2  # Skip header
+        parcel_col_idx = first_row.index('Parcel ID')  # Header consumed, skip it
     else:
         parcel_col_idx = 0  # Use first column
-        start_row = 1
+        rows = itertools.chain([first_row], rows)
     
     # Extract parcel IDs
-    for row in sheet.iter_rows(min_row=start_row, values_only=True):
+    for row in rows:
         if row and len(row) > parcel_col_idx:
-            parcel_id = str(row[parcel_col_idx]).strip() if row[parcel_col_idx] else ''
+            value = row[parcel_col_idx]
+            # Numeric cells can come back as floats (12345.0)
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            parcel_id = str(value).strip() if value else ''
             if parcel_id and parcel_id != 'None':
                 parcel_ids.append(parcel_id)
     
     return parcel_ids
 
 
+@functools.lru_cache(maxsize=1024)
 def is_parcel_id(value: str) -> bool:
     """
     Heuristic to determine if a value looks like a parcel ID
@@ -172,14 +221,11 @@ def is_parcel_id(value: str) -> bool:
     if not value:
         return False
     
-    # Check if it contains at least one digit
-    has_digit = any(c.isdigit() for c in value)
+    # Check if it contains at least one digit (translate runs in C)
+    has_digit = len(value) != len(value.translate(_NO_DIGITS))
     
     # Check if it's not a common header word
-    common_headers = ['parcel', 'id', 'number', 'pin', 'property']
-    is_header = value.lower().strip() in common_headers
-    
-    return has_digit and not is_header
+    return has_digit and value.lower().strip() not in _COMMON_HEADERS
 
 
 def validate_parcel_ids(parcel_ids: List[str], max_count: int = 1000) -> List[str]:
@@ -208,12 +254,5 @@ def validate_parcel_ids(parcel_ids: List[str], max_count: int = 1000) -> List[st
             detail=f"Too many parcel IDs. Maximum allowed: {max_count}, found: {len(parcel_ids)}"
         )
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_parcels = []
-    for parcel_id in parcel_ids:
-        if parcel_id not in seen:
-            seen.add(parcel_id)
-            unique_parcels.append(parcel_id)
-    
-    return unique_parcels
+    # Remove duplicates while preserving order (dicts keep insertion order)
+    return list(dict.fromkeys(parcel_ids))
@@ -1,5 +1,5 @@
 """
-Label exporter - generates DXF and CSV from scraped data and shapefiles
+Label exporter - generates DXF labels from scraped data and shapefiles
 Based on 2. Export Labels.py
 """
 import os
@@ -7,10 +7,13 @@ import json
 import tempfile
 import zipfile
 import re
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 import geopandas as gpd
-from pyproj import CRS
+import shapely
+from pyproj import CRS, Transformer
 import ezdxf
 
 
@@ -19,34 +22,70 @@ TEXT_HEIGHT = 5
 BOUNDARY_LAYER = "PARCEL_BOUNDARIES_NOTES"
 LABEL_LAYER = "PARCEL_LABELS"
 
+# State parcel pattern (XX-XX-XX- onwards) and separators, compiled once
+_PARCEL_TAIL_RE = re.compile(r'(\d{2}-\d{2}-\d{2}-.*)', re.DOTALL)
+_SEPARATOR_RE = re.compile(r'[-.]')
 
-def normalize_to_state_parcel(pid: str) -> str:
+# Write buffer for the output DXF, so tag lines are flushed in large blocks
+DXF_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def normalize_series_to_state_parcel(pids: pd.Series) -> pd.Series:
     """
     Normalize any parcel ID format to state parcel number (digits only).
     
+    Works on a whole column with pandas string methods. Blank, 'nan' and
+    'none' values are returned as-is.
+    
     Examples:
         "40-09-33-140-011.001-004" -> "400933140011001004"
         "29-05-10-000-010.001"     -> "290510000010001"
         "400933140011001004"       -> "400933140011001004"  (already normalized)
         "1400816928-08-22-442-023.000-025" -> extract & normalize
     """
-    pid_str = str(pid).strip()
-    if pid_str.lower() in ['nan', 'none', '']:
-        return pid_str
+    pid_str = pids.astype(str).str.strip()
+    is_blank = pid_str.str.lower().isin(['nan', 'none', ''])
     
-    # If it has dashes, it's a formatted parcel ID - first extract the real part
-    # Some IDs have extra prefix digits before the XX-XX-XX pattern
-    match = re.search(r'\d{2}-\d{2}-\d{2}-', pid_str)
-    if match:
-        pid_str = pid_str[match.start():]
+    # If it has dashes, it's a formatted parcel ID - first extract the real part.
+    # Some IDs have extra prefix digits before the XX-XX-XX pattern.
+    # Then strip all dashes and dots to get state parcel number
+    extracted = pid_str.str.extract(_PARCEL_TAIL_RE, expand=False)
+    normalized = extracted.fillna(pid_str).str.replace(_SEPARATOR_RE, '', regex=True)
     
-    # Strip all dashes and dots to get state parcel number
-    return re.sub(r'[-.]', '', pid_str)
+    return normalized.where(~is_blank, pid_str)
+
+
+# Candidate columns, in order of preference, for each label line
+OWNER_COLUMNS = ["Owner Name", "Name", "owner_name"]
+INSTRUMENT_COLUMNS = ["Document/Instrument", "Inst. # -or- book/page", "document_id"]
+
+
+# Scraped Excel columns read for labelling (plus the parcel ID column)
+EXCEL_EXTRA_COLUMNS = ["Alternate ID"]
+
+
+def _is_label_column(col) -> bool:
+    """usecols filter: keep only the Excel columns the exporter reads."""
+    name = str(col)
+    if 'parcel' in name.lower() and 'id' in name.lower():
+        return True
+    return name in OWNER_COLUMNS or name in INSTRUMENT_COLUMNS or name in EXCEL_EXTRA_COLUMNS
+
 
+def _first_present(df: pd.DataFrame, columns: list) -> pd.Series:
+    """Per row, the first non-null value among the given columns (NaN if none)."""
+    present = [col for col in columns if col in df.columns]
+    if not present:
+        return pd.Series(None, index=df.index, dtype=object)
+    # Usual case: the scraped sheet has exactly one of the candidates
+    if len(present) == 1:
+        return df[present[0]]
+    return df[present].bfill(axis=1).iloc[:, 0]
 
-def build_label(row: pd.Series) -> str:
+
+def build_labels(labels: pd.DataFrame) -> pd.Series:
     """
-    Build label text from parcel data.
+    Build label text for every parcel using column operations.
     Always uses state parcel number for output.
     
     Format:
@@ -54,43 +93,103 @@ def build_label(row: pd.Series) -> str:
     {OWNER NAME}
     INST# {number} or BK. {book}, PG. {page}
     """
-    parts = []
+    # Parcel number - prefer state parcel format
+    if "STATE_PARCEL_JOIN" in labels.columns:
+        parcel_ids = labels["STATE_PARCEL_JOIN"]
+    elif "PARCELID_JOIN" in labels.columns:
+        parcel_ids = labels["PARCELID_JOIN"]
+    else:
+        parcel_ids = normalize_series_to_state_parcel(_first_present(labels, ["Parcel ID"]))
+    parcel_part = ("PARCEL# " + parcel_ids.astype(str)).where(parcel_ids.notna())
     
-    # Add parcel number - prefer state parcel format
-    if "STATE_PARCEL_JOIN" in row and pd.notna(row["STATE_PARCEL_JOIN"]):
-        parts.append(f"PARCEL# {row['STATE_PARCEL_JOIN']}")
-    elif "PARCELID_JOIN" in row and pd.notna(row["PARCELID_JOIN"]):
-        parts.append(f"PARCEL# {row['PARCELID_JOIN']}")
-    elif "Parcel ID" in row and pd.notna(row["Parcel ID"]):
-        parts.append(f"PARCEL# {normalize_to_state_parcel(str(row['Parcel ID']))}")
+    # Owner name (capitalized)
+    owner = _first_present(labels, OWNER_COLUMNS)
+    owner_part = owner.astype(str).str.upper().where(owner.notna())
     
-    # Add owner name (capitalized)
-    owner_col = None
-    for col in ["Owner Name", "Name", "owner_name"]:
-        if col in row and pd.notna(row[col]):
-            owner_col = col
-            break
+    # Instrument number or book/page
+    inst_raw = _first_present(labels, INSTRUMENT_COLUMNS)
+    inst = inst_raw.astype(str).str.strip()
+    has_inst = inst_raw.notna() & (inst != "") & (inst.str.lower() != "nan")
+    book_page = inst.str.partition("/")
+    inst_part = (
+        ("BK. " + book_page[0].str.strip() + ", PG. " + book_page[2].str.strip())
+        .where(inst.str.contains("/", regex=False), "INST# " + inst)
+        .where(has_inst)
+    )
     
-    if owner_col:
-        parts.append(str(row[owner_col]).upper())
+    # Join present parts with newlines, skipping missing ones
+    text = parcel_part.fillna("")
+    for part in (owner_part, inst_part):
+        text = text + ("\n" + part).fillna("")
+    return text.str.replace(r"^\n", "", regex=True)
+
+
+@lru_cache(maxsize=32)
+def _crs_for_epsg(code: int) -> CRS:
+    """CRS for an EPSG code, looked up in the PROJ database once per process."""
+    return CRS.from_epsg(code)
+
+
+def reproject_geometries(geoms: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """
+    Reproject an array of shapely geometries with a prebuilt transformer.
     
-    # Add instrument number or book/page
-    inst_col = None
-    for col in ["Document/Instrument", "Inst. # -or- book/page", "document_id"]:
-        if col in row and pd.notna(row[col]):
-            inst_col = col
-            break
+    All vertices go through a single transformer.transform call on NumPy
+    arrays instead of building a new PROJ pipeline per to_crs call.
+    """
+    def _transform(coords: np.ndarray) -> np.ndarray:
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([x, y])
     
-    if inst_col:
-        inst = str(row[inst_col]).strip()
-        if inst and inst.lower() != 'nan':
-            if "/" in inst:
-                book, page = inst.split("/", 1)
-                parts.append(f"BK. {book.strip()}, PG. {page.strip()}")
-            else:
-                parts.append(f"INST# {inst}")
+    return shapely.transform(geoms, _transform)
+
+
+def exterior_rings(geoms: np.ndarray) -> List[np.ndarray]:
+    """
+    Exterior ring coordinates of every polygon, with MultiPolygons flattened.
     
-    return "\n".join(parts)
+    Coordinates are pulled out of GEOS in one call and split per ring, so
+    no per-vertex Python objects are created.
+    
+    Returns:
+        One (N, 2) array per ring, in geometry order
+    """
+    # Only polygonal geometries have boundaries to draw
+    type_ids = shapely.get_type_id(geoms)
+    polygonal = geoms[(type_ids == shapely.GeometryType.POLYGON) | (type_ids == shapely.GeometryType.MULTIPOLYGON)]
+    parts = shapely.get_parts(polygonal)
+    coords, ring_idx = shapely.get_coordinates(shapely.get_exterior_ring(parts), return_index=True)
+    if len(coords) == 0:
+        return []
+    return np.split(coords, np.flatnonzero(np.diff(ring_idx)) + 1)
+
+
+def new_label_doc():
+    """Create an empty DXF document with the boundary and label layers."""
+    doc = ezdxf.new(units=0)
+    if BOUNDARY_LAYER not in doc.layers:
+        doc.layers.add(name=BOUNDARY_LAYER)
+    if LABEL_LAYER not in doc.layers:
+        doc.layers.add(name=LABEL_LAYER)
+    return doc
+
+
+def add_parcel_entities(msp, rings: List[np.ndarray], xs: np.ndarray, ys: np.ndarray, texts: np.ndarray):
+    """Add boundary polylines and label MTEXT entities to a modelspace."""
+    boundary_attribs = {"layer": BOUNDARY_LAYER, "closed": True}
+    for coords in rings:
+        msp.add_lwpolyline(coords, dxfattribs=boundary_attribs)
+    
+    for x, y, text in zip(xs, ys, texts):
+        msp.add_mtext(
+            text,
+            dxfattribs={
+                "layer": LABEL_LAYER,
+                "char_height": TEXT_HEIGHT,
+                "insert": (x, y),
+                "attachment_point": 5,  # middle center
+            }
+        )
 
 
 class LabelExporter:
@@ -119,30 +218,24 @@ class LabelExporter:
             tempfile.gettempdir(), "parcel_jobs", job_id, "output"
         )
         os.makedirs(self.output_dir, exist_ok=True)
-        
-        self.shapefile_dir = os.path.join(
-            tempfile.gettempdir(), "parcel_jobs", job_id, "shapefiles"
-        )
-        os.makedirs(self.shapefile_dir, exist_ok=True)
 
     def _find_shapefile(self) -> str:
-        """Extract ZIP and find Parcels.shp"""
-        print("Extracting shapefiles...")
+        """
+        Find Parcels.shp inside the ZIP without extracting it.
+        
+        Returns:
+            zip:// path that read_file can open directly from the archive
+        """
         with zipfile.ZipFile(self.shapefile_zip_path, 'r') as zip_ref:
-            print(f"ZIP contents: {zip_ref.namelist()}")
-            zip_ref.extractall(self.shapefile_dir)
+            names = zip_ref.namelist()
+        print(f"ZIP contents: {names}")
         
-        for root, dirs, files in os.walk(self.shapefile_dir):
-            for file in files:
-                if file.lower() in ['parcels.shp', 'parcel.shp']:
-                    return os.path.join(root, file)
+        for name in names:
+            if os.path.basename(name).lower() in ['parcels.shp', 'parcel.shp']:
+                return f"zip://{self.shapefile_zip_path}!{name}"
         
-        extracted = []
-        for root, dirs, files in os.walk(self.shapefile_dir):
-            for file in files:
-                extracted.append(os.path.relpath(os.path.join(root, file), self.shapefile_dir))
         raise FileNotFoundError(
-            f"No Parcels.shp found in ZIP. Files: {extracted}"
+            f"No Parcels.shp found in ZIP. Files: {names}"
         )
     
     def _find_excel_parcel_col(self, df: pd.DataFrame) -> str:
@@ -165,10 +258,13 @@ class LabelExporter:
         
         # Load Excel
         print("Loading scraped data...")
+        # Every column read is text, so skip dtype inference (this also keeps
+        # numeric parcel/instrument numbers from turning into floats)
+        read_options = dict(usecols=_is_label_column, dtype=str, engine="calamine")
         try:
-            df = pd.read_excel(self.scraped_excel_path, header=0)
+            df = pd.read_excel(self.scraped_excel_path, header=0, **read_options)
         except Exception:
-            df = pd.read_excel(self.scraped_excel_path, header=1)
+            df = pd.read_excel(self.scraped_excel_path, header=1, **read_options)
         print(f"Loaded {len(df)} parcels from Excel")
         print(f"Excel columns: {df.columns.tolist()}")
         
@@ -191,10 +287,10 @@ class LabelExporter:
             gdf["STATE_PARCEL_JOIN"] = gdf['STATE_PARC'].astype(str).str.strip()
         elif 'PARCEL_ID' in gdf.columns and gdf['PARCEL_ID'].notna().sum() > 0:
             print("STATE_PARC not available, normalizing PARCEL_ID to state parcel format")
-            gdf["STATE_PARCEL_JOIN"] = gdf['PARCEL_ID'].apply(normalize_to_state_parcel)
+            gdf["STATE_PARCEL_JOIN"] = normalize_series_to_state_parcel(gdf['PARCEL_ID'])
         elif 'IDPARCEL' in gdf.columns and gdf['IDPARCEL'].notna().sum() > 0:
             print("Using IDPARCEL, normalizing to state parcel format")
-            gdf["STATE_PARCEL_JOIN"] = gdf['IDPARCEL'].apply(normalize_to_state_parcel)
+            gdf["STATE_PARCEL_JOIN"] = normalize_series_to_state_parcel(gdf['IDPARCEL'])
         else:
             raise ValueError("Could not find STATE_PARC, PARCEL_ID, or IDPARCEL in shapefile")
         
@@ -203,25 +299,25 @@ class LabelExporter:
         # Excel side: find parcel ID column and normalize to state parcel number
         parcel_col_excel = self._find_excel_parcel_col(df)
         print(f"Using Excel column: {parcel_col_excel}")
-        df["STATE_PARCEL_JOIN"] = df[parcel_col_excel].apply(normalize_to_state_parcel)
+        df["STATE_PARCEL_JOIN"] = normalize_series_to_state_parcel(df[parcel_col_excel])
         print(f"Sample Excel join keys: {df['STATE_PARCEL_JOIN'].head(5).tolist()}")
         
         # --- MATCH ---
-        excel_ids = set(df["STATE_PARCEL_JOIN"])
-        shape_ids = set(gdf["STATE_PARCEL_JOIN"])
-        matches = excel_ids.intersection(shape_ids)
-        print(f"\nExact match: {len(matches)}/{len(excel_ids)} parcels")
+        excel_ids = df["STATE_PARCEL_JOIN"].drop_duplicates()
+        n_matches = int(excel_ids.isin(gdf["STATE_PARCEL_JOIN"]).sum())
+        print(f"\nExact match: {n_matches}/{len(excel_ids)} parcels")
         
         # If no exact matches, try prefix matching.
         # Users may input local IDs without the township suffix, e.g.:
         #   Input:    "290510000010001"     (15 digits)
         #   Shapefile: "290510000010001013"  (18 digits, with township)
         # In this case the input is a prefix of the state parcel number.
-        if len(matches) == 0:
+        if n_matches == 0:
             print("No exact matches. Trying prefix match (input may lack township suffix)...")
             
             # Build a prefix lookup: for each shapefile ID, index all prefixes
             # that could match a shorter input ID
+            shape_ids = gdf["STATE_PARCEL_JOIN"].unique()
             prefix_map = {}  # excel_id -> shapefile_state_parcel
             for eid in excel_ids:
                 for sid in shape_ids:
@@ -235,14 +331,14 @@ class LabelExporter:
                 df["STATE_PARCEL_JOIN"] = df["STATE_PARCEL_JOIN"].map(
                     lambda x: prefix_map.get(x, x)
                 )
-                matches = set(df["STATE_PARCEL_JOIN"]).intersection(shape_ids)
-                print(f"After prefix resolution: {len(matches)} matches")
+                n_matches = int(df["STATE_PARCEL_JOIN"].drop_duplicates().isin(gdf["STATE_PARCEL_JOIN"]).sum())
+                print(f"After prefix resolution: {n_matches} matches")
         
-        if len(matches) == 0:
+        if n_matches == 0:
             # Diagnostic dump
             print("\n=== MATCH FAILURE DIAGNOSTICS ===")
-            print(f"Excel IDs (first 5): {list(excel_ids)[:5]}")
-            print(f"Shapefile IDs (first 5): {list(shape_ids)[:5]}")
+            print(f"Excel IDs (first 5): {excel_ids.head(5).tolist()}")
+            print(f"Shapefile IDs (first 5): {gdf['STATE_PARCEL_JOIN'].drop_duplicates().head(5).tolist()}")
             for col in gdf.columns:
                 if col not in ('geometry', 'STATE_PARCEL_JOIN'):
                     samples = gdf[col].dropna().head(3).tolist()
@@ -256,33 +352,38 @@ class LabelExporter:
         
         # --- JOIN ---
         print("Joining data...")
-        joined = gdf.merge(df, on="STATE_PARCEL_JOIN", how="inner")
+        # Shared categories turn the key comparison into integer codes
+        join_dtype = pd.CategoricalDtype(
+            pd.unique(pd.concat([gdf["STATE_PARCEL_JOIN"], df["STATE_PARCEL_JOIN"]], ignore_index=True))
+        )
+        gdf["STATE_PARCEL_JOIN"] = gdf["STATE_PARCEL_JOIN"].astype(join_dtype)
+        df["STATE_PARCEL_JOIN"] = df["STATE_PARCEL_JOIN"].astype(join_dtype)
+        joined = gdf.join(
+            df.set_index("STATE_PARCEL_JOIN"), on="STATE_PARCEL_JOIN",
+            how="inner", lsuffix="_x", rsuffix="_y"
+        )
         
         if joined.empty:
             raise ValueError("Join produced zero records.")
         
         print(f"Joined {len(joined)} parcels")
         
-        # Store original geometry for boundaries
-        joined["boundary_geom"] = joined.geometry
-        
-        # Compute label points
-        print("Computing label points...")
-        joined["label_point"] = joined.geometry.representative_point()
-        labels = gpd.GeoDataFrame(joined, geometry="label_point", crs=gdf.crs)
-        
-        # Reproject
+        # Reproject boundaries once (plain shapely arrays from here on)
         print(f"Reprojecting to EPSG:{self.crs_id}...")
-        target_crs = CRS.from_epsg(self.crs_id)
-        labels = labels.to_crs(target_crs)
-        labels["boundary_geom"] = labels["boundary_geom"].to_crs(target_crs)
+        target_crs = _crs_for_epsg(self.crs_id)
+        transformer = Transformer.from_crs(gdf.crs, target_crs, always_xy=True)
+        boundaries = reproject_geometries(joined.geometry.to_numpy(), transformer)
+        labels = pd.DataFrame(joined.drop(columns=joined.geometry.name))
         
-        labels["X"] = labels.geometry.x
-        labels["Y"] = labels.geometry.y
+        # Compute label points on the reprojected polygons
+        print("Computing label points...")
+        label_points = shapely.point_on_surface(boundaries)
+        labels["X"] = shapely.get_x(label_points)
+        labels["Y"] = shapely.get_y(label_points)
         
         # Build labels (uses state parcel number)
         print("Building labels...")
-        labels["LABEL"] = labels.apply(build_label, axis=1)
+        labels["LABEL"] = build_labels(labels)
         
         # Debug: sample labels
         print("\nSample labels:")
@@ -294,40 +395,21 @@ class LabelExporter:
         dxf_path = os.path.join(self.output_dir, "labels.dxf")
         print("Creating DXF...")
         
-        doc = ezdxf.new(units=0)
+        doc = new_label_doc()
         msp = doc.modelspace()
         
-        if BOUNDARY_LAYER not in doc.layers:
-            doc.layers.add(name=BOUNDARY_LAYER)
-        if LABEL_LAYER not in doc.layers:
-            doc.layers.add(name=LABEL_LAYER)
+        rings = exterior_rings(boundaries)
+        xs = labels["X"].to_numpy()
+        ys = labels["Y"].to_numpy()
+        texts = labels["LABEL"].to_numpy()
         
-        # Add parcel boundaries
-        print(f"Adding {len(labels)} parcel boundaries...")
-        for idx, row in labels.iterrows():
-            geom = row["boundary_geom"]
-            if geom.geom_type == 'Polygon':
-                coords = list(geom.exterior.coords)
-                msp.add_lwpolyline(coords, dxfattribs={"layer": BOUNDARY_LAYER, "closed": True})
-            elif geom.geom_type == 'MultiPolygon':
-                for poly in geom.geoms:
-                    coords = list(poly.exterior.coords)
-                    msp.add_lwpolyline(coords, dxfattribs={"layer": BOUNDARY_LAYER, "closed": True})
-        
-        # Add labels
-        print(f"Adding {len(labels)} labels...")
-        for _, row in labels.iterrows():
-            msp.add_mtext(
-                row["LABEL"],
-                dxfattribs={
-                    "layer": LABEL_LAYER,
-                    "char_height": TEXT_HEIGHT,
-                    "insert": (row["X"], row["Y"]),
-                    "attachment_point": 5,  # middle center
-                }
-            )
+        print(f"Adding {len(rings)} parcel boundaries and {len(labels)} labels...")
+        add_parcel_entities(msp, rings, xs, ys, texts)
         
-        doc.saveas(dxf_path)
+        # Same as doc.saveas(), but with a large write buffer
+        with open(dxf_path, "wt", encoding=doc.output_encoding, errors="dxfreplace",
+                  buffering=DXF_WRITE_BUFFER_SIZE) as f:
+            doc.write(f)
         print(f"Wrote DXF: {dxf_path}")
         
         print(f"\nLabelExporter: Complete!")
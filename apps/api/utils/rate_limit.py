@@ -0,0 +1,74 @@
+"""
+Token-bucket rate limiting for outbound requests
+
+Buckets are shared by every job in the process, so concurrent jobs (and
+retries) together stay under the GIS portals' and Azure's request rates
+instead of each pacing itself independently.
+"""
+import asyncio
+import random
+import threading
+import time
+from config.settings import (
+    AZURE_OPS_RATE,
+    AZURE_OPS_BURST,
+    SCRAPER_PAGE_RATE,
+    SCRAPER_PAGE_BURST
+)
+
+# Waits are stretched by up to this fraction so throttled callers don't wake in lockstep
+JITTER_FRACTION = 0.1
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from threads and event loops alike
+
+    Tokens refill continuously at `rate` per second up to `burst`. A caller
+    that finds the bucket empty reserves its tokens anyway (the balance goes
+    negative) and sleeps until they would have refilled, so waiters are
+    served in arrival order without polling.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (requests allowed back to back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, n: float) -> float:
+        """Take n tokens and return how long to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= n
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+        return wait * (1 + random.uniform(0, JITTER_FRACTION))
+
+    def acquire(self, n: float = 1) -> None:
+        """Block the calling thread until n tokens are available"""
+        wait = self._reserve(n)
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self, n: float = 1) -> None:
+        """Wait on the running event loop until n tokens are available"""
+        wait = self._reserve(n)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+# Azure Blob Storage HTTP requests, taken by AzureStorageManager's pipeline for every request
+azure_ops_bucket = TokenBucket(AZURE_OPS_RATE, AZURE_OPS_BURST)
+
+# GIS portal page requests (one per parcel lookup)
+scraper_page_bucket = TokenBucket(SCRAPER_PAGE_RATE, SCRAPER_PAGE_BURST)
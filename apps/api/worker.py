@@ -3,22 +3,64 @@ Background worker for processing parcel research jobs
 """
 import time
 import threading
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import sys
 import asyncio
 from datetime import datetime
 from typing import Optional
+from pymongo import CursorType, UpdateOne
+from pymongo.errors import OperationFailure, PyMongoError
 from models.ParcelJob import ParcelJob
-from scrapers.platform_factory import get_scraper
-from utils.label_exporter import LabelExporter
 from config.settings import (
     SCRAPER_PAGE_DELAY_MIN,
     SCRAPER_PAGE_DELAY_MAX,
     SCRAPER_PDF_DELAY_MIN,
     SCRAPER_PDF_DELAY_MAX,
-    SCRAPER_BROWSER_TIMEOUT_MS
+    SCRAPER_BROWSER_TIMEOUT_MS,
+    WORKER_MAX_CONCURRENT_JOBS
 )
 import traceback
 
+# Tailable cursor on job_events: how long the server waits for a new event
+# before returning an empty batch (also how often the loop checks for stop())
+JOB_EVENTS_MAX_AWAIT_MS = 1000
+
+# Change stream on ParcelJob inserts: how long the server holds an empty
+# getMore (also how often the loop checks for stop()), and events per batch
+# (large enough that a burst of submissions arrives in one round-trip)
+CHANGE_STREAM_MAX_AWAIT_MS = 1000
+CHANGE_STREAM_BATCH_SIZE = 500
+
+# worker_state document holding the last processed change stream resume token
+WORKER_STATE_ID = "parcel_worker"
+
+# Server error when a resume token is older than the oplog window
+CHANGE_STREAM_HISTORY_LOST = 286
+
+# Server errors for a tailable cursor that timed out or was killed (CursorNotFound, CursorKilled)
+TAILABLE_CURSOR_LOST = {43, 237}
+
+# Events only need the job id; drop the rest of the job document from each event
+CHANGE_STREAM_PROJECTION = {
+    "_id": 1,
+    "ns": 1,
+    "documentKey": 1,
+    "fullDocument._id": 1,
+    "fullDocument.status": 1
+}
+
+# How long a wait for a free job slot blocks before checking for stop() again
+JOB_SLOT_WAIT_SECONDS = 1
+
+# Progress reported by scrapers is coalesced and written at most this often (seconds)
+PROGRESS_FLUSH_INTERVAL = 0.5
+
+# Worker log output; handlers are set up by ParcelJobWorker.start()
+logger = logging.getLogger("parcel_worker")
+LOG_FORMAT = "%(asctime)s [%(threadName)s] %(levelname)s %(message)s"
+
 # On Windows, set event loop policy to support subprocess operations (required by Playwright)
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -26,78 +68,328 @@ if sys.platform == 'win32':
 
 class ParcelJobWorker:
     """
-    Background worker that polls for pending parcel jobs and processes them
+    Background worker that picks up pending parcel jobs and processes them
+    
+    New jobs are delivered by tailing the capped job_events collection the
+    API appends to, or by a change stream on servers without capped
+    collections (Azure Cosmos DB), with polling as the last resort. Up to
+    max_concurrent_jobs jobs run at once; a job is only claimed when a
+    slot is free, so other workers can pick up the rest.
     """
     
-    def __init__(self, db_manager, poll_interval: int = 5):
+    def __init__(self, db_manager, poll_interval: int = 5, max_concurrent_jobs: int = WORKER_MAX_CONCURRENT_JOBS):
         """
         Initialize worker
         
         Args:
             db_manager: DatabaseManager instance
-            poll_interval: Seconds between polling for new jobs
+            poll_interval: Seconds between polling for new jobs (used when
+                change streams are not available, and after errors)
+            max_concurrent_jobs: Jobs processed at the same time
         """
         self.db = db_manager
+        # Shared storage manager: one BlobServiceClient/HTTP pool for every job's transfers
+        self.az = db_manager.az
         self.poll_interval = poll_interval
         self.running = False
         self._thread: Optional[threading.Thread] = None
+        self._use_change_stream = True
+        self._resume_token = None
+        
+        # A slot is taken before each claim and freed when the job's task finishes
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self._job_slots = threading.BoundedSemaphore(max_concurrent_jobs)
+        
+        # Queue-backed log handler and its listener thread, when start() installs them
+        self._log_handler: Optional[QueueHandler] = None
+        self._log_listener: Optional[QueueListener] = None
+        
+        # Event loop that runs job pipelines; blocking steps go to threads from it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # One scraper per platform, reused by every job (scrapers keep no per-job state)
+        self._scrapers: dict = {}
+        self._scrapers_lock = threading.Lock()
+        
+        # Latest parcels_completed per job, waiting to be written by the progress flusher
+        self._pending_progress: dict = {}
+        self._progress_lock = threading.Lock()
+        self._progress_thread: Optional[threading.Thread] = None
     
     def start(self):
         """Start the worker in a background thread"""
         if self.running:
-            print("Worker already running")
+            logger.info("Worker already running")
             return
         
+        self._start_logging()
         self.running = True
+        self._start_loop()
         self._thread = threading.Thread(target=self._run, daemon=True, name="ParcelJobWorker")
         self._thread.start()
-        print("ParcelJobWorker started")
+        self._progress_thread = threading.Thread(target=self._run_progress_flusher, daemon=True, name="ParcelJobProgress")
+        self._progress_thread.start()
+        logger.info("ParcelJobWorker started")
     
     def stop(self):
         """Stop the worker"""
         self.running = False
         if self._thread:
             self._thread.join(timeout=10)
-        print("ParcelJobWorker stopped")
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=10)
+        if self._progress_thread:
+            self._progress_thread.join(timeout=10)
+        self._flush_progress()
+        # Browsers used by scrapers belong to the shared pool, which main.py shuts down
+        with self._scrapers_lock:
+            self._scrapers.clear()
+        logger.info("ParcelJobWorker stopped")
+        self._stop_logging()
+    
+    def _start_logging(self):
+        """
+        Route worker logs through a queue so job threads only enqueue records
+        
+        A listener thread formats them and writes to stderr. If the app has
+        configured logging itself, records just propagate to its handlers.
+        """
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+        if self._log_listener is not None or logging.getLogger().handlers:
+            return
+        
+        log_queue = queue.Queue(-1)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self._log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        self._log_listener.start()
+        self._log_handler = QueueHandler(log_queue)
+        logger.addHandler(self._log_handler)
+    
+    def _stop_logging(self):
+        """Remove the queue handler and flush and stop its listener thread"""
+        if self._log_listener is None:
+            return
+        logger.removeHandler(self._log_handler)
+        self._log_listener.stop()
+        self._log_handler = None
+        self._log_listener = None
+    
+    def _start_loop(self):
+        """Start the job event loop on its own thread"""
+        self._loop = asyncio.new_event_loop()
+        # Eager tasks run synchronously until their first real wait (Python 3.12+)
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory:
+            self._loop.set_task_factory(eager_task_factory)
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True, name="ParcelJobWorkerLoop")
+        self._loop_thread.start()
     
     def _run(self):
         """Main worker loop"""
-        print("ParcelJobWorker: Starting main loop")
+        logger.info("ParcelJobWorker: Starting main loop")
         
-        # On Windows, set event loop policy for this thread
-        import sys
-        import asyncio
-        if sys.platform == 'win32':
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        # Resume the change stream where the last run left off
+        if self.db.jobEventsCollection is None:
+            self._resume_token = self._load_resume_token()
         
         while self.running:
             try:
-                # Get next pending job (FIFO)
-                job_data = self.db.parcelJobsCollection.find_one_and_update(
-                    {"status": "pending"},
-                    {"$set": {
-                        "status": "processing",
-                        "started_at": datetime.utcnow(),
-                        "updated_at": datetime.utcnow()
-                    }},
-                    sort=[("created_at", 1)],  # FIFO
-                    return_document=True
-                )
-                
-                if job_data:
-                    job = ParcelJob(**job_data)
-                    print(f"Processing job {job.id} for {job.county} county")
-                    self._process_job(job)
+                if self.db.jobEventsCollection is not None:
+                    self._tail_job_events()
+                elif self._use_change_stream:
+                    self._watch_for_jobs()
                 else:
-                    # No pending jobs, sleep
+                    self._process_pending_jobs()
                     time.sleep(self.poll_interval)
                     
             except Exception as e:
-                print(f"Worker error: {e}")
-                traceback.print_exc()
+                logger.exception("Worker error: %s", e)
                 time.sleep(self.poll_interval)
     
-    def _process_job(self, job: ParcelJob):
+    def _tail_job_events(self):
+        """
+        Process jobs as the API records them in the capped job_events collection
+        
+        Returns when the worker stops or the tailable cursor dies (it is
+        then reopened by _run).
+        """
+        events = self.db.jobEventsCollection
+        
+        # Tailable cursors die straight away on an empty collection, so keep a marker in it
+        newest = events.find_one({}, {"_id": 1}, sort=[("$natural", -1)])
+        if newest is None:
+            newest = {"_id": events.insert_one({"job_id": None, "ts": datetime.utcnow()}).inserted_id}
+        
+        # Only events after the newest existing one; older jobs are drained below
+        cursor = events.find(
+            {"_id": {"$gt": newest["_id"]}},
+            cursor_type=CursorType.TAILABLE_AWAIT
+        ).max_await_time_ms(JOB_EVENTS_MAX_AWAIT_MS)
+        
+        with cursor:
+            self._process_pending_jobs()
+            
+            # Iteration ends after max_await_time_ms without events so stop() is noticed
+            try:
+                while self.running and cursor.alive:
+                    for event in cursor:
+                        if event.get("job_id") is None:
+                            continue
+                        self._claim_and_submit({"_id": event["job_id"], "status": "pending"})
+                        if not self.running:
+                            break
+            except OperationFailure as e:
+                # Waiting for a free job slot can outlast the server's cursor
+                # timeout; _run simply opens a new cursor
+                if e.code not in TAILABLE_CURSOR_LOST:
+                    raise
+                logger.info("Job events cursor lost (%s), reopening", e.code)
+    
+    def _watch_for_jobs(self):
+        """
+        Process jobs as they are inserted, using a change stream on the job collection
+        
+        Returns when the worker stops or the stream closes; falls back to
+        polling if the server does not support change streams.
+        """
+        pipeline = [
+            {"$match": {"operationType": "insert", "fullDocument.status": "pending"}},
+            {"$project": CHANGE_STREAM_PROJECTION}
+        ]
+        resume = {"resume_after": self._resume_token} if self._resume_token else {}
+        
+        try:
+            stream = self.db.parcelJobsCollection.watch(
+                pipeline,
+                full_document="updateLookup",
+                max_await_time_ms=CHANGE_STREAM_MAX_AWAIT_MS,
+                batch_size=CHANGE_STREAM_BATCH_SIZE,
+                **resume
+            )
+        except OperationFailure as e:
+            if self._resume_token:
+                # Token too old to resume from; reopen from now (pending jobs are drained below)
+                logger.info("Cannot resume change stream (%s), reopening from now", e)
+                self._save_resume_token(None)
+                return
+            logger.info("Change streams not available (%s), polling every %ss instead", e, self.poll_interval)
+            self._use_change_stream = False
+            return
+        
+        with stream:
+            # Jobs submitted before the stream opened have no event to deliver,
+            # nor do stale jobs reset to pending at startup
+            self._process_pending_jobs()
+            
+            # try_next returns None after max_await_time_ms so stop() is noticed
+            try:
+                while self.running and stream.alive:
+                    change = stream.try_next()
+                    if change is None:
+                        continue
+                    self._claim_and_submit({"_id": change["documentKey"]["_id"], "status": "pending"})
+                    self._save_resume_token(stream.resume_token)
+            except OperationFailure as e:
+                if e.code != CHANGE_STREAM_HISTORY_LOST:
+                    raise
+                # Events were lost; reopen from now, which drains pending jobs
+                logger.info("Change stream history lost, rescanning pending jobs")
+                self._save_resume_token(None)
+    
+    def _load_resume_token(self):
+        """Read the persisted change stream resume token, if any"""
+        try:
+            state = self.db.workerStateCollection.find_one({"_id": WORKER_STATE_ID})
+        except PyMongoError as e:
+            logger.warning("Could not load change stream resume token: %s", e)
+            return None
+        return state.get("resume_token") if state else None
+    
+    def _save_resume_token(self, token):
+        """Remember (or with None, forget) the change stream position, in memory and in worker_state"""
+        self._resume_token = token
+        try:
+            self.db.workerStateCollection.update_one(
+                {"_id": WORKER_STATE_ID},
+                {"$set": {"resume_token": token}, "$currentDate": {"updated_at": True}},
+                upsert=True
+            )
+        except PyMongoError as e:
+            # The in-memory token still covers this process; a restart just reopens from now
+            logger.warning("Could not save change stream resume token: %s", e)
+    
+    def _process_pending_jobs(self):
+        """Claim and start pending jobs (FIFO) until none are left"""
+        while self.running:
+            if not self._claim_and_submit({"status": "pending"}):
+                return
+    
+    def _claim_and_submit(self, job_filter: dict) -> bool:
+        """
+        Wait for a free job slot, then claim a matching job and start it on the job event loop
+        
+        Args:
+            job_filter: Filter selecting the pending job(s) to claim
+            
+        Returns:
+            True if a job was claimed, False if none matched or the worker stopped
+        """
+        while not self._job_slots.acquire(timeout=JOB_SLOT_WAIT_SECONDS):
+            if not self.running:
+                return False
+        
+        try:
+            job = self._claim_job(job_filter)
+        except Exception:
+            self._job_slots.release()
+            raise
+        if not job:
+            self._job_slots.release()
+            return False
+        
+        try:
+            task = asyncio.run_coroutine_threadsafe(self._run_job(job), self._loop)
+        except Exception:
+            self._job_slots.release()
+            raise
+        task.add_done_callback(lambda _: self._job_slots.release())
+        return True
+    
+    def _claim_job(self, job_filter: dict) -> Optional[ParcelJob]:
+        """
+        Atomically move a matching pending job to processing
+        
+        Args:
+            job_filter: Filter selecting the pending job(s) to claim
+            
+        Returns:
+            The claimed job, or None if nothing matched (or another worker won)
+        """
+        job_data = self.db.parcelJobsCollection.find_one_and_update(
+            job_filter,
+            {
+                "$set": {"status": "processing"},
+                # Server time, so timestamps stay ordered across workers
+                "$currentDate": {"started_at": True, "updated_at": True}
+            },
+            sort=[("created_at", 1)],  # FIFO
+            return_document=True
+        )
+        return ParcelJob(**job_data) if job_data else None
+    
+    async def _run_job(self, job: ParcelJob):
+        """Process a claimed job as a task on the job event loop"""
+        try:
+            logger.info("Processing job %s for %s county", job.id, job.county)
+            await self._process_job(job)
+        except Exception as e:
+            logger.exception("Job %s stopped unexpectedly: %s", job.id, e)
+    
+    async def _process_job(self, job: ParcelJob):
         """
         Process a single parcel job
         
@@ -108,177 +400,261 @@ class ParcelJobWorker:
         4. Match with shapefiles
         5. Generate DXF + CSV labels
         6. Upload results to Azure
+        
+        Runs on the worker's event loop; the Mongo, Azure, scraping and
+        export steps are blocking calls and run in threads.
         """
         try:
-            # Check if job was cancelled before starting
-            current_job = self.db.parcelJobsCollection.find_one({"_id": job.id})
-            if current_job and current_job.get("status") == "cancelled":
-                print(f"Job {job.id} was cancelled, skipping processing")
+            # Status updates only apply while the job isn't cancelled, so each
+            # one doubles as the cancellation check
+            if not await asyncio.to_thread(self._update_job_status, job.id, "processing", "Parsing parcel file"):
+                logger.info("Job %s was cancelled, skipping processing", job.id)
                 return
             
             # Step 1: Verify input files exist, download from Azure if missing
             import os
             
+            downloads = []
             if not os.path.exists(job.parcel_file_path):
-                print(f"Parcel file not found locally, downloading from Azure: {job.azure_parcel_path}")
+                logger.info("Parcel file not found locally, downloading from Azure: %s", job.azure_parcel_path)
                 os.makedirs(os.path.dirname(job.parcel_file_path), exist_ok=True)
-                self.db.az.download_file(job.azure_parcel_path, job.parcel_file_path)
+                downloads.append(asyncio.to_thread(self.az.download_file, job.azure_parcel_path, job.parcel_file_path))
             
             if not os.path.exists(job.shapefile_zip_path):
-                print(f"Shapefile not found locally, downloading from Azure: {job.azure_shapefile_path}")
+                logger.info("Shapefile not found locally, downloading from Azure: %s", job.azure_shapefile_path)
                 os.makedirs(os.path.dirname(job.shapefile_zip_path), exist_ok=True)
-                self.db.az.download_file(job.azure_shapefile_path, job.shapefile_zip_path)
+                downloads.append(asyncio.to_thread(self.az.download_file, job.azure_shapefile_path, job.shapefile_zip_path))
             
-            # Step 2: Update status
-            self._update_job_status(job.id, "processing", "Parsing parcel file")
+            # Both downloads run at the same time
+            await asyncio.gather(*downloads)
             
-            # Step 3: Get platform-specific scraper
-            scraper = get_scraper(job.platform)
+            # Step 2: Get platform-specific scraper
+            # Scrapers (Playwright, pandas) and the exporter (geopandas, pyproj, ezdxf)
+            # are imported on first use so they don't slow down API startup
+            from utils.label_exporter import LabelExporter
             
-            # Step 3: Scrape parcels
-            self._update_job_status(job.id, "processing", f"Scraping {job.parcel_count} parcels from {job.platform}")
-            
-            scraped_data = scraper.scrape_parcels(
-                parcel_file_path=job.parcel_file_path,
-                base_url=job.gis_url,
-                county=job.county,
-                job_id=job.id,
-                progress_callback=lambda completed, total: self._update_progress(job.id, completed, total)
-            )
+            scraper = self._get_scraper(job.platform)
             
-            # Check if cancelled during scraping
-            current_job = self.db.parcelJobsCollection.find_one({"_id": job.id})
-            if current_job and current_job.get("status") == "cancelled":
-                print(f"Job {job.id} was cancelled during scraping")
+            # Step 3: Scrape parcels
+            if not await asyncio.to_thread(
+                self._update_job_status, job.id, "processing", f"Scraping {job.parcel_count} parcels from {job.platform}"
+            ):
+                logger.info("Job %s was cancelled, skipping scraping", job.id)
                 return
             
-            # Step 4: Process shapefiles and generate labels
-            self._update_job_status(job.id, "processing", "Generating labels and DXF")
-            
-            exporter = LabelExporter(
-                scraped_excel_path=scraped_data["excel_path"],
-                shapefile_zip_path=job.shapefile_zip_path,
-                crs_id=job.crs_id,
-                job_id=job.id
-            )
+            try:
+                scraped_data = await asyncio.to_thread(
+                    scraper.scrape_parcels,
+                    parcel_file_path=job.parcel_file_path,
+                    base_url=job.gis_url,
+                    county=job.county,
+                    job_id=job.id,
+                    progress_callback=lambda completed, total: self._update_progress(job.id, completed, total)
+                )
+            finally:
+                # Write the final count before the job moves on
+                await asyncio.to_thread(self._flush_progress)
             
-            output_files = exporter.export()
+            # Step 4: Process shapefiles and generate labels
+            if not await asyncio.to_thread(self._update_job_status, job.id, "processing", "Generating labels and DXF"):
+                logger.info("Job %s was cancelled during scraping", job.id)
+                return
             
-            # Step 5: Upload results to Azure
-            self._update_job_status(job.id, "processing", "Uploading results")
+            # The Excel and PRC.zip uploads don't depend on the labels, so they
+            # start now and run while the DXF is generated
+            uploads = self._start_uploads(job.id, scraped_data)
             
-            results = self._upload_results(job.id, output_files, scraped_data)
+            try:
+                exporter = LabelExporter(
+                    scraped_excel_path=scraped_data["excel_path"],
+                    shapefile_zip_path=job.shapefile_zip_path,
+                    crs_id=job.crs_id,
+                    job_id=job.id
+                )
+                
+                output_files = await asyncio.to_thread(exporter.export)
+                
+                # Step 5: Upload results to Azure
+                if not await asyncio.to_thread(self._update_job_status, job.id, "processing", "Uploading results"):
+                    logger.info("Job %s was cancelled during label generation", job.id)
+                    await asyncio.gather(*(task for _, task in uploads.values()), return_exceptions=True)
+                    return
+                
+                uploads.update(self._start_uploads(job.id, output_files))
+                results = await self._finish_uploads(uploads)
+            except Exception:
+                # Let uploads already in flight settle before the job is marked failed
+                await asyncio.gather(*(task for _, task in uploads.values()), return_exceptions=True)
+                raise
             
             # Step 6: Mark as completed
-            self.db.parcelJobsCollection.update_one(
+            await asyncio.to_thread(
+                self.db.parcelJobsCollection.update_one,
                 {"_id": job.id},
-                {"$set": {
-                    "status": "completed",
-                    "results": results,
-                    "completed_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow()
-                }}
+                {
+                    "$set": {"status": "completed", "results": results},
+                    "$currentDate": {"completed_at": True, "updated_at": True}
+                }
             )
             
-            print(f"Job {job.id} completed successfully")
+            logger.info("Job %s completed successfully", job.id)
             
         except Exception as e:
             error_msg = f"Job failed: {str(e)}\n{traceback.format_exc()}"
-            print(f"Job {job.id} failed: {error_msg}")
+            logger.error("Job %s failed: %s", job.id, error_msg)
             
-            self.db.parcelJobsCollection.update_one(
+            await asyncio.to_thread(
+                self.db.parcelJobsCollection.update_one,
                 {"_id": job.id},
-                {"$set": {
-                    "status": "failed",
-                    "error_message": error_msg,
-                    "completed_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow()
-                }}
+                {
+                    "$set": {"status": "failed", "error_message": error_msg},
+                    "$currentDate": {"completed_at": True, "updated_at": True}
+                }
             )
     
-    def _update_job_status(self, job_id: str, status: str, current_step: str):
-        """Update job status and current step"""
-        self.db.parcelJobsCollection.update_one(
-            {"_id": job_id},
-            {"$set": {
-                "status": status,
-                "current_step": current_step,
-                "updated_at": datetime.utcnow()
-            }}
+    def _get_scraper(self, platform: str):
+        """
+        Get the worker's scraper for a platform, creating it on first use
+        
+        Args:
+            platform: Platform name from the job
+            
+        Returns:
+            Platform-specific scraper instance shared by this worker's jobs
+        """
+        # Scrapers (Playwright, pandas) are imported on first use so they don't slow down API startup
+        from scrapers.platform_factory import get_scraper
+        
+        key = platform.lower()
+        with self._scrapers_lock:
+            if key not in self._scrapers:
+                self._scrapers[key] = get_scraper(platform)
+            return self._scrapers[key]
+    
+    def _update_job_status(self, job_id: str, status: str, current_step: str) -> bool:
+        """
+        Update job status and current step, unless the job has been cancelled
+        
+        Returns:
+            False if the job was cancelled (nothing is written)
+        """
+        result = self.db.parcelJobsCollection.update_one(
+            {"_id": job_id, "status": {"$ne": "cancelled"}},
+            {
+                "$set": {"status": status, "current_step": current_step},
+                "$currentDate": {"updated_at": True}
+            }
         )
+        return result.matched_count > 0
     
     def _update_progress(self, job_id: str, completed: int, total: int):
-        """Update job progress"""
-        self.db.parcelJobsCollection.update_one(
-            {"_id": job_id},
-            {"$set": {
-                "parcels_completed": completed,
-                "updated_at": datetime.utcnow()
-            }}
-        )
+        """
+        Record job progress
+        
+        Scrapers may report after every parcel, so only the latest count is
+        kept here and the progress flusher writes it.
+        """
+        with self._progress_lock:
+            self._pending_progress[job_id] = completed
+    
+    def _run_progress_flusher(self):
+        """Write coalesced progress every PROGRESS_FLUSH_INTERVAL seconds"""
+        while self.running:
+            time.sleep(PROGRESS_FLUSH_INTERVAL)
+            self._flush_progress()
     
-    def _upload_results(self, job_id: str, output_files: dict, scraped_data: dict) -> dict:
+    def _flush_progress(self):
+        """Write all pending progress counts in one unordered bulk write"""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, {}
+        if not pending:
+            return
+        
+        try:
+            self.db.parcelJobsCollection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": job_id},
+                        # $max so a delayed flush can never move the count backwards
+                        {"$max": {"parcels_completed": completed}, "$currentDate": {"updated_at": True}}
+                    )
+                    for job_id, completed in pending.items()
+                ],
+                ordered=False
+            )
+        except PyMongoError as e:
+            # Progress is informational; the next report overwrites it anyway
+            logger.warning("Progress update failed: %s", e)
+    
+    def _start_uploads(self, job_id: str, files: dict) -> dict:
         """
-        Upload result files to Azure in jobs/{job_id}/ folder and return public URLs
+        Start uploading result files to Azure in jobs/{job_id}/ folder
         
         Args:
             job_id: Job ID
-            output_files: Dict with path to DXF file
-            scraped_data: Dict with paths to Excel, PDFs
+            files: Scraper or exporter output, with any of excel_path,
+                dxf_path and pdfs_dir
             
         Returns:
-            Dict with public URLs for all result files
+            Dict of result URL key -> (blob name, upload task)
         """
-        results = {}
-        
         # All files go in jobs/{job_id}/ folder
         job_folder = f"jobs/{job_id}"
+        uploads = {}
         
-        # Upload Excel file
-        if "excel_path" in scraped_data:
+        # Excel file
+        if "excel_path" in files:
             blob_name = f"{job_folder}/parcels_enriched.xlsx"
-            self.db.az.upload_file(scraped_data["excel_path"], blob_name)
-            results["excel_url"] = self.db.az.get_public_url(blob_name)
+            uploads["excel_url"] = (blob_name, asyncio.create_task(
+                asyncio.to_thread(self.az.upload_file, files["excel_path"], blob_name)
+            ))
         
-        # Upload DXF file
-        if "dxf_path" in output_files:
+        # DXF file
+        if "dxf_path" in files:
             blob_name = f"{job_folder}/labels.dxf"
-            self.db.az.upload_file(output_files["dxf_path"], blob_name)
-            results["dxf_url"] = self.db.az.get_public_url(blob_name)
+            uploads["dxf_url"] = (blob_name, asyncio.create_task(
+                asyncio.to_thread(self.az.upload_file, files["dxf_path"], blob_name)
+            ))
         
-        # Upload PDFs as PRC.zip (extracts to PRC folder)
-        if "pdfs_dir" in scraped_data:
-            import shutil
-            import os
-            
-            # Create PRC folder structure for ZIP
-            temp_prc_dir = f"/tmp/{job_id}_PRC"
-            prc_folder = os.path.join(temp_prc_dir, "PRC")
-            os.makedirs(prc_folder, exist_ok=True)
-            
-            # Copy PDFs to PRC folder
-            for pdf_file in os.listdir(scraped_data["pdfs_dir"]):
-                if pdf_file.endswith('.pdf'):
-                    src = os.path.join(scraped_data["pdfs_dir"], pdf_file)
-                    dst = os.path.join(prc_folder, pdf_file)
-                    shutil.copy2(src, dst)
-            
-            # Create ZIP (will contain PRC folder)
-            prc_zip_path = f"/tmp/{job_id}_PRC.zip"
-            shutil.make_archive(
-                prc_zip_path.replace('.zip', ''),
-                'zip',
-                temp_prc_dir
-            )
-            
+        # PDFs as PRC.zip (extracts to PRC folder)
+        if "pdfs_dir" in files:
             blob_name = f"{job_folder}/PRC.zip"
-            self.db.az.upload_file(prc_zip_path, blob_name)
-            results["prc_zip_url"] = self.db.az.get_public_url(blob_name)
+            uploads["prc_zip_url"] = (blob_name, asyncio.create_task(
+                asyncio.to_thread(self._upload_prc_zip, files["pdfs_dir"], blob_name)
+            ))
+        
+        return uploads
+    
+    async def _finish_uploads(self, uploads: dict) -> dict:
+        """
+        Wait for uploads started by _start_uploads and return public URLs
+        
+        Args:
+            uploads: Dict of result URL key -> (blob name, upload task)
             
-            # Clean up temp files
-            if os.path.exists(prc_zip_path):
-                os.remove(prc_zip_path)
-            if os.path.exists(temp_prc_dir):
-                shutil.rmtree(temp_prc_dir)
+        Returns:
+            Dict with public URLs for all result files
+        """
+        await asyncio.gather(*(task for _, task in uploads.values()))
+        
+        return {key: self.az.get_public_url(blob_name) for key, (blob_name, _) in uploads.items()}
+    
+    def _upload_prc_zip(self, pdfs_dir: str, blob_name: str):
+        """
+        Stream the downloaded PDFs into a ZIP blob containing a PRC folder
+        
+        The archive is written straight into staged blob blocks, so it is
+        never built on local disk. PDFs are already compressed, so entries
+        are stored rather than deflated.
+        """
+        import zipfile
+        import os
         
-        return results
+        with self.az.open_blob_writer(blob_name, content_type="application/zip") as writer:
+            with zipfile.ZipFile(writer, "w", zipfile.ZIP_STORED) as zf:
+                # scandir entries carry their path and file type, so no extra join/stat per PDF
+                with os.scandir(pdfs_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.pdf') and entry.is_file():
+                            zf.write(entry.path, arcname=f"PRC/{entry.name}")
+        logger.info("Uploaded PRC archive as blob %s", blob_name)